@@ -27,5 +27,21 @@ echo "Redis is ready!"
 echo "Running database migrations..."
 alembic upgrade head
 
-# Start the application
-exec uvicorn chat_store.main:app --host 0.0.0.0 --port 8000
\ No newline at end of file
+# Start the application. Every worker owns its own database and Redis pools,
+# so the worker count multiplies the connection budget (see DatabaseConfig
+# and RedisConfig in chat_store/core/config.py). Unless WEB_CONCURRENCY is
+# set, run 2 * CPU + 1 workers capped at 4. Exported so the app can check its
+# database pool budget against it at startup.
+if [ -z "${WEB_CONCURRENCY:-}" ]; then
+    WEB_CONCURRENCY=$((2 * $(nproc) + 1))
+    if [ "$WEB_CONCURRENCY" -gt 4 ]; then
+        WEB_CONCURRENCY=4
+    fi
+fi
+export WEB_CONCURRENCY
+exec uvicorn chat_store.main:app \
+    --host 0.0.0.0 \
+    --port 8000 \
+    --loop uvloop \
+    --http httptools \
+    --workers "$WEB_CONCURRENCY"
\ No newline at end of file
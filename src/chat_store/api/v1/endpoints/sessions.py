@@ -1,5 +1,10 @@
+from typing import Any
 from uuid import UUID
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
 
 from chat_store.services.session_service import SessionService
 from chat_store.services.message_service import MessageService
@@ -7,13 +12,43 @@ from chat_store.schemas.session import SessionCreate, SessionUpdate, Session, Se
 from chat_store.schemas.message import MessageCreate, Message, MessageList, ResumeResponse
 from chat_store.services.auth import verify_api_key
 from chat_store.dependencies import get_session_service, get_message_service
-from chat_store.core.rate_limiter import limiter
+from chat_store.core.rate_limiter import get_rate_limit_string, limiter_strict, limiter_fast
 
 router = APIRouter()
 
+# Response adapters are built once at import so no request pays for schema
+# construction; handlers render through them straight into orjson.
+SESSION_TA = TypeAdapter(Session)
+SESSIONS_TA = TypeAdapter(list[Session])
+MESSAGE_TA = TypeAdapter(Message)
+MESSAGES_TA = TypeAdapter(list[Message])
+RESUME_TA = TypeAdapter(ResumeResponse)
+
+# Pages larger than this are encoded in a worker thread
+OFFLOAD_ENCODE_THRESHOLD = 200
+
+
+def _render(adapter: TypeAdapter, data: Any, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """Validate ORM objects or dicts against `adapter` and return them as JSON."""
+    content = adapter.dump_python(adapter.validate_python(data, from_attributes=True), mode="json")
+    return ORJSONResponse(content=content, status_code=status_code)
+
+
+async def _render_page(adapter: TypeAdapter, key: str, rows: list, total: int) -> Response:
+    """Validate a page of ORM rows in one batch and return it with its total."""
+    # Validation reads ORM attributes, so it stays on the event loop thread
+    items = adapter.validate_python(rows, from_attributes=True)
+    if len(items) <= OFFLOAD_ENCODE_THRESHOLD:
+        return ORJSONResponse(content={key: adapter.dump_python(items, mode="json"), "total": total})
+
+    body = await run_in_threadpool(
+        lambda: orjson.dumps({key: adapter.dump_python(items, mode="json"), "total": total})
+    )
+    return Response(content=body, media_type="application/json")
+
 
 @router.post("/", response_model=Session, status_code=status.HTTP_201_CREATED)
-@limiter.limit("10/minute")
+@limiter_strict.limit(get_rate_limit_string("create_session"))
 async def create_session(
     request: Request,
     response: Response,
@@ -22,11 +57,12 @@ async def create_session(
     api_key: str = Depends(verify_api_key)
 ):
     """Create a new chat session."""
-    return await service.create_session(session_in)
+    session = await service.create_session(session_in)
+    return _render(SESSION_TA, session, status.HTTP_201_CREATED)
 
 
-@router.get("/", response_model=SessionList)
-@limiter.limit("30/minute")
+@router.get("/", response_model=SessionList, response_class=ORJSONResponse)
+@limiter_fast.limit(get_rate_limit_string("list_sessions"))
 async def list_sessions(
     request: Request,
     response: Response,
@@ -38,11 +74,11 @@ async def list_sessions(
 ):
     """List sessions for a specific user with pagination."""
     sessions, total = await service.get_user_sessions(user_id, skip, limit)
-    return SessionList(sessions=sessions, total=total)
+    return await _render_page(SESSIONS_TA, "sessions", sessions, total)
 
 
 @router.put("/{session_id}", response_model=Session)
-@limiter.limit("20/minute")
+@limiter_strict.limit(get_rate_limit_string("update_session"))
 async def update_session(
     request: Request,
     response: Response,
@@ -65,11 +101,11 @@ async def update_session(
             detail="Session not found"
         )
     
-    return updated_session
+    return _render(SESSION_TA, updated_session)
 
 
 @router.patch("/{session_id}/favorite", response_model=Session)
-@limiter.limit("20/minute")
+@limiter_strict.limit(get_rate_limit_string("toggle_favorite"))
 async def toggle_favorite(
     request: Request,
     response: Response,
@@ -86,11 +122,11 @@ async def toggle_favorite(
             detail="Session not found"
         )
     
-    return updated_session
+    return _render(SESSION_TA, updated_session)
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-@limiter.limit("10/minute")
+@limiter_strict.limit(get_rate_limit_string("delete_session"))
 async def delete_session(
     request: Request,
     response: Response,
@@ -109,35 +145,30 @@ async def delete_session(
 # Messages
 
 @router.post("/{session_id}/messages", response_model=Message, status_code=status.HTTP_201_CREATED)
-@limiter.limit("50/minute")
+@limiter_strict.limit(get_rate_limit_string("create_message"))
 async def create_session_message(
     request: Request,
     response: Response,
     session_id: UUID,
     message_in: MessageCreate,
     message_service: MessageService = Depends(get_message_service),
-    session_service: SessionService = Depends(get_session_service),
     api_key: str = Depends(verify_api_key)
 ):
     """Create a new message in a specific session."""
-    session_exists = await session_service.session_exists(session_id)
-    if not session_exists:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
-    
     try:
-        return await message_service.create_message(session_id, message_in)
+        message = await message_service.create_message(session_id, message_in)
     except ValueError as e:
+        # Raised when the session does not exist
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=404,
             detail=str(e)
         )
 
+    return _render(MESSAGE_TA, message, status.HTTP_201_CREATED)
+
 
-@router.get("/{session_id}/messages", response_model=MessageList)
-@limiter.limit("100/minute")
+@router.get("/{session_id}/messages", response_model=MessageList, response_class=ORJSONResponse)
+@limiter_fast.limit(get_rate_limit_string("get_messages"))
 async def list_session_messages(
     request: Request,
     response: Response,
@@ -145,46 +176,31 @@ async def list_session_messages(
     skip: int = Query(0, ge=0, description="Skip N items"),
     limit: int = Query(100, ge=1, le=1000, description="Limit N items"),
     message_service: MessageService = Depends(get_message_service),
-    session_service: SessionService = Depends(get_session_service),
     api_key: str = Depends(verify_api_key)
 ):
     """Get paginated messages for a specific session with advanced filtering."""
-    session_exists = await session_service.session_exists(session_id)
-    if not session_exists:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
-    
     try:
         messages, total = await message_service.get_session_messages(session_id, skip, limit)
-        return MessageList(messages=messages, total=total)
     except ValueError as e:
         raise HTTPException(
             status_code=404,
             detail=str(e)
         )
 
+    return await _render_page(MESSAGES_TA, "messages", messages, total)
+
 
 @router.get("/{session_id}/messages/{message_id}", response_model=Message)
-@limiter.limit("100/minute")
+@limiter_fast.limit(get_rate_limit_string("get_messages"))
 async def get_session_message(
     request: Request,
     response: Response,
     session_id: UUID,
     message_id: UUID,
     message_service: MessageService = Depends(get_message_service),
-    session_service: SessionService = Depends(get_session_service),
     api_key: str = Depends(verify_api_key)
 ):
     """Get a specific message from a session."""
-    session_exists = await session_service.session_exists(session_id)
-    if not session_exists:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
-    
     message = await message_service.get_message_by_id(message_id)
     if not message or message.session_id != session_id:
         raise HTTPException(
@@ -192,28 +208,20 @@ async def get_session_message(
             detail=f"Message {message_id} not found in session {session_id}"
         )
     
-    return message
+    return _render(MESSAGE_TA, message)
 
 
 @router.post("/{session_id}/messages/{message_id}/resume", response_model=ResumeResponse)
-@limiter.limit("5/minute")
+@limiter_strict.limit(get_rate_limit_string("resume_message"))
 async def resume_session_message(
     request: Request,
     response: Response,
     session_id: UUID,
     message_id: UUID,
     message_service: MessageService = Depends(get_message_service),
-    session_service: SessionService = Depends(get_session_service),
     api_key: str = Depends(verify_api_key)
 ):
     """Resume a failed or pending message in a specific session."""
-    session_exists = await session_service.session_exists(session_id)
-    if not session_exists:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Session {session_id} not found"
-        )
-    
     message = await message_service.get_message_by_id(message_id)
     if not message or message.session_id != session_id:
         raise HTTPException(
@@ -222,9 +230,11 @@ async def resume_session_message(
         )
     
     try:
-        return await message_service.resume_failed_message(session_id)
+        resumed = await message_service.resume_failed_message(session_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
-        )
\ No newline at end of file
+        )
+
+    return _render(RESUME_TA, resumed)
\ No newline at end of file
@@ -1,7 +1,7 @@
 from functools import lru_cache
 from typing import List
 
-from pydantic import PostgresDsn, RedisDsn, SecretStr, model_validator
+from pydantic import Field, PostgresDsn, RedisDsn, SecretStr, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +11,7 @@ class DatabaseConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     DATABASE_HOST: str = "localhost"
@@ -20,6 +21,18 @@ class DatabaseConfig(BaseSettings):
     DATABASE_PORT: int = 5432
     DATABASE_URI: PostgresDsn | None = None
 
+    # Per-worker pool. Every worker opens its own, so the server must allow
+    # WEB_CONCURRENCY * (DATABASE_POOL_SIZE + DATABASE_MAX_OVERFLOW)
+    # connections; Config checks that against DATABASE_MAX_CONNECTIONS
+    # (Postgres' max_connections, minus headroom for migrations and admin).
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 2
+    DATABASE_POOL_TIMEOUT: int = 10
+    DATABASE_MAX_CONNECTIONS: int = 90
+    # Connections each worker opens at startup so the first requests skip
+    # the handshake; kept small as every worker warms up at the same time
+    DATABASE_POOL_MIN_SIZE: int = 2
+
     PGADMIN_DEFAULT_EMAIL: str = "admin@chat-store.com"
     PGADMIN_DEFAULT_PASSWORD: str = "admin123"
 
@@ -42,6 +55,7 @@ class RedisConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     REDIS_HOST: str = "localhost"
@@ -49,6 +63,13 @@ class RedisConfig(BaseSettings):
     REDIS_PASSWORD: SecretStr = SecretStr("redis")
     REDIS_URI: RedisDsn | None = None
 
+    # Per-worker pool shared by the rate limiters; short timeouts so a
+    # stalled Redis fails open instead of blocking the event loop. Each hit is
+    # a single EVALSHA, so a few connections cover a worker's concurrency.
+    REDIS_MAX_CONNECTIONS: int = 16
+    REDIS_SOCKET_TIMEOUT: float = 0.2
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30
+
     @model_validator(mode="before")
     def parse_redis_uri(cls, values) -> "RedisConfig":
         values["REDIS_URI"] = RedisDsn.build(
@@ -66,6 +87,7 @@ class AuthConfig(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     API_KEY: str = "api_key"
@@ -78,12 +100,16 @@ class Config(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     PROJECT_NAME: str = "Chat Store"
     API_V1_STR: str = "/api/v1"
     DEBUG: bool = True
 
+    # Number of server processes sharing the database; set by the entrypoint
+    WEB_CONCURRENCY: int = 1
+
     ADMIN_EMAIL: str = "admin@chat-store.com"
     ADMIN_PASSWORD: SecretStr = SecretStr("password123")
 
@@ -103,9 +129,9 @@ class Config(BaseSettings):
     RATE_LIMIT_DELETE_SESSION: str = "10/minute"
     RATE_LIMIT_TOGGLE_FAVORITE: str = "20/minute"
 
-    auth: AuthConfig = AuthConfig()
-    database: DatabaseConfig = DatabaseConfig()
-    redis: RedisConfig = RedisConfig()
+    auth: AuthConfig = Field(default_factory=AuthConfig)
+    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    redis: RedisConfig = Field(default_factory=RedisConfig)
 
     @model_validator(mode="before")
     @classmethod
@@ -137,10 +163,19 @@ class Config(BaseSettings):
         if not self.database.DATABASE_URI:
             raise ValueError("Database URI is required")
         
+        db = self.database
+        per_worker = db.DATABASE_POOL_SIZE + db.DATABASE_MAX_OVERFLOW
+        if self.WEB_CONCURRENCY * per_worker > db.DATABASE_MAX_CONNECTIONS:
+            raise ValueError(
+                f"{self.WEB_CONCURRENCY} workers x {per_worker} pooled connections "
+                f"exceeds DATABASE_MAX_CONNECTIONS ({db.DATABASE_MAX_CONNECTIONS}); "
+                "lower WEB_CONCURRENCY or the per-worker pool size"
+            )
+        
         return self
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     return Config()
 
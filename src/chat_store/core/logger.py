@@ -1,7 +1,9 @@
+import itertools
 import logging
+import os
 import sys
-import uuid
 from typing import Optional
+import orjson
 import structlog
 from contextvars import ContextVar, Token
 import time
@@ -10,6 +12,22 @@ import time
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 user_id_var: ContextVar[Optional[str]] = ContextVar("user_id", default=None)
 
+_WARNING_AND_ABOVE = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+
+# Process-local request ID sequence; the pid in the high bits keeps IDs from
+# different workers apart, the clock in the low bits keeps restarts apart.
+_request_ids = itertools.count((os.getpid() << 32) | (time.time_ns() & 0xFFFFFFFF))
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSON serializer for structlog's JSONRenderer; orjson returns bytes."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def next_request_id() -> str:
+    """Return the next request ID for this process as 16 hex characters."""
+    return format(next(_request_ids) & 0xFFFFFFFFFFFFFFFF, "016x")
+
 
 def setup_logging(log_level: str = "INFO", enable_access_log: bool = False):
     """
@@ -39,19 +57,31 @@ def setup_logging(log_level: str = "INFO", enable_access_log: bool = False):
             
         return event_dict
     
+    render_stack_info = structlog.processors.StackInfoRenderer()
+
+    def render_exc_and_stack(logger, method_name, event_dict):
+        """Render stack and exception info for WARNING and above only."""
+        if method_name not in _WARNING_AND_ABOVE:
+            event_dict.pop("stack_info", None)
+            event_dict.pop("exc_info", None)
+            return event_dict
+        event_dict = render_stack_info(logger, method_name, event_dict)
+        return structlog.processors.format_exc_info(logger, method_name, event_dict)
+
     shared_processors = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+        render_exc_and_stack,
         add_app_info,
         add_request_context,
     ]
 
     structlog.configure(
         processors=[
+            # Drop disabled levels before any other processor runs
+            structlog.stdlib.filter_by_level,
             *shared_processors,
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
@@ -62,7 +92,7 @@ def setup_logging(log_level: str = "INFO", enable_access_log: bool = False):
 
     formatter = structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=shared_processors,
-        processor=structlog.processors.JSONRenderer(),
+        processor=structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     )
 
     handler = logging.StreamHandler(sys.stdout)
@@ -96,7 +126,7 @@ class LoggingContext:
     """Context manager for setting request context variables."""
     
     def __init__(self, request_id: Optional[str] = None, user_id: Optional[str] = None):
-        self.request_id = request_id or str(uuid.uuid4())
+        self.request_id = request_id or next_request_id()
         self.user_id = user_id
         self.request_token: Optional[Token[Optional[str]]] = None
         self.user_token: Optional[Token[Optional[str]]] = None
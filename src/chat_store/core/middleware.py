@@ -1,76 +1,110 @@
+import logging
 import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
-from chat_store.core.logger import get_logger, LoggingContext
+import xxhash
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from chat_store.core.logger import get_logger, next_request_id, LoggingContext
 
 logger = get_logger(__name__)
+# The stdlib logger backing `logger`, for cheap level checks
+_level_logger = logging.getLogger(__name__)
+
+
+# Request headers the logging middleware reads, collected in one scan
+_LOGGED_HEADERS = frozenset({
+    b"x-request-id",
+    b"x-user-id",
+    b"user-agent",
+    b"content-length",
+    b"x-forwarded-for",
+    b"x-real-ip",
+})
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """Middleware for logging requests and responses with correlation IDs."""
-    
-    async def dispatch(self, request: Request, call_next):
-        # Generate request ID if not provided
-        request_id = request.headers.get("X-Request-ID") or str(time.time_ns())
-        
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {}
+        for name, value in scope["headers"]:
+            if name in _LOGGED_HEADERS and name not in headers:
+                headers[name] = value.decode("latin-1")
+
+        # Generate request ID if not provided; scope["state"] backs request.state
+        request_id = headers.get(b"x-request-id") or next_request_id()
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+
         # Extract user ID from various sources
-        user_id = None
-        if hasattr(request.state, 'user_id'):
-            user_id = request.state.user_id
-        elif request.headers.get("X-User-ID"):
-            user_id = request.headers.get("X-User-ID")
-        
+        user_id = state.get("user_id") or headers.get(b"x-user-id")
+
+        # Skip building the log fields entirely when INFO is disabled
+        log_info = _level_logger.isEnabledFor(logging.INFO)
+        method = scope["method"]
+        path = scope["path"]
+        start_time = time.perf_counter()
+        response_started = False
+
+        async def send_with_request_id(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                response_headers = MutableHeaders(scope=message)
+                response_headers["X-Request-ID"] = request_id
+
+                # Log successful response
+                if log_info:
+                    logger.info(
+                        "request_completed",
+                        method=method,
+                        path=path,
+                        status_code=message["status"],
+                        duration_seconds=time.perf_counter() - start_time,
+                        content_length=response_headers.get("content-length"),
+                    )
+            await send(message)
+
         # Set up logging context
         with LoggingContext(request_id=request_id, user_id=user_id):
             # Log request
-            logger.info(
-                "request_started",
-                method=request.method,
-                path=request.url.path,
-                query_params=str(request.query_params),
-                user_agent=request.headers.get("user-agent"),
-                client_ip=self._get_client_ip(request),
-                content_length=request.headers.get("content-length"),
-            )
-            
-            start_time = time.time()
-            
-            try:
-                # Process request
-                response = await call_next(request)
-                
-                # Log successful response
-                duration = time.time() - start_time
+            if log_info:
                 logger.info(
-                    "request_completed",
-                    method=request.method,
-                    path=request.url.path,
-                    status_code=response.status_code,
-                    duration_seconds=duration,
-                    content_length=response.headers.get("content-length"),
+                    "request_started",
+                    method=method,
+                    path=path,
+                    query_params=scope["query_string"].decode("latin-1"),
+                    user_agent=headers.get(b"user-agent"),
+                    client_ip=self._get_client_ip(scope, headers),
+                    content_length=headers.get(b"content-length"),
                 )
-                
-                # Add request ID to response headers
-                response.headers["X-Request-ID"] = request_id
-                
-                return response
-                
+
+            try:
+                await self.app(scope, receive, send_with_request_id)
             except Exception as exc:
                 # Log error
-                duration = time.time() - start_time
                 logger.error(
                     "request_failed",
-                    method=request.method,
-                    path=request.url.path,
-                    duration_seconds=duration,
+                    method=method,
+                    path=path,
+                    duration_seconds=time.perf_counter() - start_time,
                     error=str(exc),
                     error_type=type(exc).__name__,
                 )
-                
+                if response_started:
+                    raise
+
                 # Return error response with request ID
-                return JSONResponse(
+                response = ORJSONResponse(
                     status_code=500,
                     content={
                         "detail": "Internal server error",
@@ -78,25 +112,96 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     },
                     headers={"X-Request-ID": request_id}
                 )
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request headers."""
-        forwarded = request.headers.get("X-Forwarded-For")
+                await response(scope, receive, send)
+
+    def _get_client_ip(self, scope: Scope, headers: dict) -> str:
+        """Extract client IP from request headers, caching it on request.state."""
+        state = scope["state"]
+        cached = state.get("client_ip")
+        if cached is not None:
+            return cached
+
+        forwarded = headers.get(b"x-forwarded-for")
+        real_ip = headers.get(b"x-real-ip")
         if forwarded:
-            return forwarded.split(",")[0].strip()
-        
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-        
-        return request.client.host if request.client else "unknown"
+            # Only the left-most (original client) entry matters
+            client_ip = forwarded.partition(",")[0].strip()
+        elif real_ip:
+            client_ip = real_ip
+        else:
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+
+        state["client_ip"] = client_ip
+        return client_ip
 
 
-class DatabaseQueryLoggingMiddleware(BaseHTTPMiddleware):
+class DatabaseQueryLoggingMiddleware:
     """Middleware for logging database queries."""
-    
-    async def dispatch(self, request: Request, call_next):
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # This would integrate with SQLAlchemy event listeners
         # For now, we'll just pass through
-        response = await call_next(request)
-        return response
\ No newline at end of file
+        await self.app(scope, receive, send)
+
+
+class ETagMiddleware:
+    """Tag GET responses with a weak ETag and answer matching If-None-Match with 304."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message: Message = {}
+        body = []
+
+        async def send_with_etag(message: Message):
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    # Pass non-cacheable responses straight through
+                    start_message = {}
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if not start_message:
+                await send(message)
+                return
+
+            body.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            content = b"".join(body)
+            etag = f'W/"{xxhash.xxh3_64_hexdigest(content)}"'
+            headers = MutableHeaders(raw=list(start_message["headers"]))
+            headers["ETag"] = etag
+
+            if if_none_match and _etag_matches(if_none_match, etag):
+                del headers["Content-Length"]
+                await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": content})
+
+        await self.app(scope, receive, send_with_etag)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
@@ -1,22 +1,206 @@
+import time
+import uuid
+from functools import wraps
 from typing import Optional
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from fastapi import FastAPI
 
-from chat_store.core.config import config
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import NoScriptError, RedisError
+
+from chat_store.core.config import Config, config
 from chat_store.core.logger import get_logger
 
 logger = get_logger(__name__)
 
-# Initialize the rate limiter with Redis storage
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["200/hour"],
-    storage_uri=str(config.redis.REDIS_URI),
-    headers_enabled=True,
-    strategy="fixed-window"
-)
+# Trims the window, counts the remaining hits and records the current hit in
+# a single atomic round-trip. Returns the count *before* this request.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, now .. ':' .. ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+end
+return count
+"""
+
+# Cloudflare-style approximation: the previous fixed window's counter is
+# weighted by how much of it still overlaps the sliding window. O(1) per hit
+# and two small integer keys per client instead of one ZSET entry per request.
+APPROXIMATE_WINDOW_SCRIPT = """
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local count = math.floor(previous * (window - elapsed) / window) + current
+if count < tonumber(ARGV[1]) then
+    if redis.call('INCR', KEYS[1]) == 1 then
+        redis.call('PEXPIRE', KEYS[1], window * 2)
+    end
+end
+return count
+"""
+
+_PERIOD_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+
+def parse_rate_limit(limit_value: str) -> tuple[int, int]:
+    """Parse a "<amount>/<period>" string into (amount, window in milliseconds)."""
+    amount, _, period = limit_value.partition("/")
+    period = period.strip().lower().rstrip("s")
+    if not amount.strip().isdigit() or period not in _PERIOD_SECONDS:
+        raise ValueError(f"Invalid rate limit: {limit_value!r}")
+    return int(amount), _PERIOD_SECONDS[period] * 1000
+
+
+class SlidingWindowLimiter:
+    """Redis-backed sliding-window rate limiter using a preloaded Lua script."""
+
+    script = SLIDING_WINDOW_SCRIPT
+
+    def __init__(self, connection_pool: ConnectionPool, key_prefix: str = "rl"):
+        self.connection_pool = connection_pool
+        self.key_prefix = key_prefix
+        self._redis: Optional[Redis] = None
+        self._script_sha: Optional[str] = None
+
+    @property
+    def redis(self) -> Redis:
+        if self._redis is None:
+            self._redis = Redis(connection_pool=self.connection_pool)
+        return self._redis
+
+    async def load_script(self) -> str:
+        """Register the Lua script with Redis and cache its SHA."""
+        self._script_sha = await self.redis.script_load(self.script)
+        return self._script_sha
+
+    async def close(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def _script_call(self, key: str, amount: int, window_ms: int) -> tuple[list[str], tuple]:
+        """Build the KEYS and ARGV passed to the Lua script."""
+        now_ms = time.time_ns() // 1_000_000
+        return [key], (now_ms, window_ms, amount, uuid.uuid4().hex)
+
+    async def hit(self, key: str, amount: int, window_ms: int) -> int:
+        """Record a hit for `key` and return the number of hits already in the window."""
+        if self._script_sha is None:
+            await self.load_script()
+
+        keys, args = self._script_call(key, amount, window_ms)
+        try:
+            return int(await self.redis.evalsha(self._script_sha, len(keys), *keys, *args))
+        except NoScriptError:
+            # Redis was restarted or flushed; reload and retry once
+            await self.load_script()
+            return int(await self.redis.evalsha(self._script_sha, len(keys), *keys, *args))
+
+    def limit(self, limit_value: str):
+        """Decorate an endpoint with a "<amount>/<period>" rate limit."""
+        amount, window_ms = parse_rate_limit(limit_value)
+
+        def decorator(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                request: Request = kwargs["request"]
+                client_ip = request.client.host if request.client else "127.0.0.1"
+                key = f"{self.key_prefix}:{func.__name__}:{client_ip}"
+
+                try:
+                    count = await self.hit(key, amount, window_ms)
+                except RedisError as exc:
+                    logger.warning("rate_limiter_unavailable", key=key, error=str(exc))
+                    return await func(*args, **kwargs)
+
+                if count >= amount:
+                    logger.warning("rate_limit_exceeded", key=key, limit=limit_value)
+                    raise HTTPException(
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        detail=f"Rate limit exceeded: {limit_value}",
+                        headers={
+                            "Retry-After": str(window_ms // 1000),
+                            "X-RateLimit-Limit": str(amount),
+                            "X-RateLimit-Remaining": "0",
+                        },
+                    )
+
+                result = await func(*args, **kwargs)
+
+                target = result if isinstance(result, Response) else kwargs.get("response")
+                if target is not None:
+                    target.headers["X-RateLimit-Limit"] = str(amount)
+                    target.headers["X-RateLimit-Remaining"] = str(amount - count - 1)
+                return result
+
+            # Record which limiter and limit guard the endpoint
+            wrapper.limiter = self
+            wrapper.rate_limit = limit_value
+            return wrapper
+
+        return decorator
+
+
+class ApproximateWindowLimiter(SlidingWindowLimiter):
+    """Approximate sliding-window limiter built from two fixed-window counters."""
+
+    script = APPROXIMATE_WINDOW_SCRIPT
+
+    def _script_call(self, key: str, amount: int, window_ms: int) -> tuple[list[str], tuple]:
+        now_ms = time.time_ns() // 1_000_000
+        window_start = now_ms - now_ms % window_ms
+        keys = [f"{key}:{window_start}", f"{key}:{window_start - window_ms}"]
+        return keys, (amount, window_ms, now_ms - window_start)
+
+
+class _NoopLimiter:
+    """Stand-in used when rate limiting is disabled; `limit` leaves endpoints untouched."""
+
+    def limit(self, limit_value: Optional[str]):
+        return lambda func: func
+
+    async def load_script(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+def _build_limiters(settings: Config):
+    """Return the shared Redis pool and the (strict, fast) limiters for `settings`.
+
+    `limiter_strict` keeps an exact sliding window (one ZSET entry per hit)
+    for mutating endpoints where boundary bursts matter; `limiter_fast`
+    approximates the window with two O(1) counters for high-QPS reads. Redis
+    connections are only opened on the first hit, from a pool both limiters
+    share. With rate limiting disabled there is no pool and both limiters
+    leave endpoints untouched.
+    """
+    if not settings.RATE_LIMITER_ENABLED:
+        noop = _NoopLimiter()
+        return None, noop, noop
+
+    pool = ConnectionPool.from_url(
+        str(settings.redis.REDIS_URI),
+        max_connections=settings.redis.REDIS_MAX_CONNECTIONS,
+        socket_timeout=settings.redis.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.redis.REDIS_SOCKET_TIMEOUT,
+        socket_keepalive=True,
+        health_check_interval=settings.redis.REDIS_HEALTH_CHECK_INTERVAL,
+    )
+    return pool, SlidingWindowLimiter(pool), ApproximateWindowLimiter(pool)
+
+
+redis_pool, limiter_strict, limiter_fast = _build_limiters(config)
 
 
 def setup_rate_limiter(app: FastAPI):
@@ -24,11 +208,10 @@ def setup_rate_limiter(app: FastAPI):
     if not config.RATE_LIMITER_ENABLED:
         logger.info("rate_limiter_disabled")
         return
-    
+
     # Add the limiter to the app
-    app.state.limiter = limiter
-    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-    
+    app.state.limiter = limiter_strict
+
     logger.info(
         "rate_limiter_enabled",
         max_requests=config.RATE_LIMITER_MAX_REQUESTS,
@@ -36,20 +219,49 @@ def setup_rate_limiter(app: FastAPI):
     )
 
 
+async def init_rate_limiter():
+    """Preload the rate limiter scripts so requests only issue EVALSHA."""
+    if not config.RATE_LIMITER_ENABLED:
+        return
+
+    try:
+        await limiter_strict.load_script()
+        await limiter_fast.load_script()
+    except RedisError as exc:
+        logger.warning("rate_limiter_script_load_failed", error=str(exc))
+
+
+async def close_rate_limiter():
+    """Release the rate limiters' Redis connections."""
+    await limiter_strict.close()
+    await limiter_fast.close()
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+
+
+_RATE_LIMITS = {
+    "create_session": config.RATE_LIMIT_CREATE_SESSION,
+    "list_sessions": config.RATE_LIMIT_LIST_SESSIONS,
+    "create_message": config.RATE_LIMIT_CREATE_MESSAGE,
+    "get_messages": config.RATE_LIMIT_GET_MESSAGES,
+    "resume_message": config.RATE_LIMIT_RESUME_MESSAGE,
+    "update_session": config.RATE_LIMIT_UPDATE_SESSION,
+    "delete_session": config.RATE_LIMIT_DELETE_SESSION,
+    "toggle_favorite": config.RATE_LIMIT_TOGGLE_FAVORITE,
+}
+
+
 def get_rate_limit_string(endpoint_type: str) -> Optional[str]:
-    """Get rate limit string for specific endpoint type."""
+    """Get rate limit string for specific endpoint type.
+
+    Returns None while rate limiting is disabled; raises KeyError for an
+    endpoint type without a configured limit, so a typo fails at import time
+    instead of leaving the endpoint unlimited.
+    """
     if not config.RATE_LIMITER_ENABLED:
         return None
-    
-    rate_limits = {
-        "create_session": config.RATE_LIMIT_CREATE_SESSION,
-        "list_sessions": config.RATE_LIMIT_LIST_SESSIONS,
-        "create_message": config.RATE_LIMIT_CREATE_MESSAGE,
-        "get_messages": config.RATE_LIMIT_GET_MESSAGES,
-        "resume_message": config.RATE_LIMIT_RESUME_MESSAGE,
-        "update_session": config.RATE_LIMIT_UPDATE_SESSION,
-        "delete_session": config.RATE_LIMIT_DELETE_SESSION,
-        "toggle_favorite": config.RATE_LIMIT_TOGGLE_FAVORITE,
-    }
-    
-    return rate_limits.get(endpoint_type)
+
+    try:
+        return _RATE_LIMITS[endpoint_type]
+    except KeyError:
+        raise KeyError(f"No rate limit configured for endpoint type {endpoint_type!r}") from None
@@ -1,32 +1,47 @@
 import uuid
 from datetime import datetime
+from typing import AsyncIterator
 
+import orjson
 from sqlalchemy import MetaData
-from sqlalchemy import TIMESTAMP, func, UUID
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import TIMESTAMP, Uuid, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from chat_store.core.config import config
 
 
+def _orjson_dumps(obj) -> str:
+    """JSON column serializer; orjson returns bytes, the driver wants text."""
+    return orjson.dumps(obj).decode()
+
+
 engine = create_async_engine(
     str(config.database.DATABASE_URI),
     echo=config.DEBUG,
-    pool_size=20,
-    max_overflow=30,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=config.database.DATABASE_POOL_SIZE,
+    max_overflow=config.database.DATABASE_MAX_OVERFLOW,
+    pool_timeout=config.database.DATABASE_POOL_TIMEOUT,
     pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_recycle=1800,
+    # Room for every repository statement shape (the default is 500)
+    query_cache_size=1200,
+    # JSON columns (message context) are encoded and decoded with orjson
+    json_serializer=_orjson_dumps,
+    json_deserializer=orjson.loads,
 )
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 
-async def get_db() -> AsyncSession:
+async def get_db() -> AsyncIterator[AsyncSession]:
+    # One session, and one transaction, per request. Services commit once at
+    # the end of a write; anything left uncommitted (e.g. after an exception)
+    # is rolled back when the session closes. The commit is not done here
+    # because FastAPI runs this teardown only after the response is sent.
     async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+        yield session
 
 
 naming_convention = {
@@ -39,6 +54,9 @@ naming_convention = {
 
 class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=naming_convention)
+    # Fetch server-generated columns (timestamps) with INSERT ... RETURNING
+    # instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimeStampMixin:
@@ -56,9 +74,11 @@ class TimeStampMixin:
 
 
 class UUIDMixin:
+    # Generated client-side only: a server default would stop SQLAlchemy using
+    # the key as an insertmanyvalues sentinel, and multi-row INSERT ... RETURNING
+    # would fall back to one statement per row.
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True),
+        Uuid(as_uuid=True),
         primary_key=True,
-        server_default=func.gen_random_uuid(),
         default=uuid.uuid4
     )
\ No newline at end of file
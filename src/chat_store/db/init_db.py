@@ -1,4 +1,11 @@
-from chat_store.db.base import engine, Base
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from chat_store.core.config import config
+from chat_store.db.base import Base, engine
 from chat_store.core.logger import get_logger, PerformanceTimer
 
 # Import models to ensure they're registered with SQLAlchemy
@@ -6,9 +13,45 @@ from chat_store.models import Message, Session  # noqa: F401
 
 logger = get_logger(__name__)
 
+# Advisory lock key that serializes schema creation across workers
+_SCHEMA_LOCK_KEY = 0x63686174  # "chat"
+
 
 async def init_db():
-    with PerformanceTimer(logger, "database_initialization"):
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-            logger.info("database_initialized", tables=list(Base.metadata.tables.keys()))
\ No newline at end of file
+    # One-shot engine so schema creation never holds a slot in the request pool
+    engine = create_async_engine(str(config.database.DATABASE_URI), poolclass=NullPool)
+    try:
+        with PerformanceTimer(logger, "database_initialization"):
+            async with engine.begin() as conn:
+                # Every worker runs this at startup. On a fresh database their
+                # concurrent CREATE TYPE / TABLE statements would collide, so
+                # they take turns; the lock is released when the transaction
+                # ends, and later workers find the schema already there.
+                await conn.execute(
+                    text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY}
+                )
+                await conn.run_sync(Base.metadata.create_all)
+                logger.info("database_initialized", tables=list(Base.metadata.tables.keys()))
+    finally:
+        await engine.dispose()
+
+
+async def warm_up_pool():
+    """Open DATABASE_POOL_MIN_SIZE connections and return them to the pool."""
+    size = min(config.database.DATABASE_POOL_MIN_SIZE, config.database.DATABASE_POOL_SIZE)
+    with PerformanceTimer(logger, "database_pool_warm_up"):
+        results = await asyncio.gather(
+            *(engine.connect().start() for _ in range(size)), return_exceptions=True
+        )
+        # Return the connections that did open to the pool, then surface the
+        # first failure as it was raised (e.g. the database refusing connections)
+        await asyncio.gather(*(conn.close() for conn in results if not isinstance(conn, BaseException)))
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+    logger.info("database_pool_warmed", connections=size)
+
+
+async def close_db():
+    """Close every pooled connection."""
+    await engine.dispose()
@@ -6,7 +6,7 @@ from chat_store.repositories.session_repository import SessionRepository
 from chat_store.repositories.message_repository import MessageRepository
 from chat_store.services.session_service import SessionService
 from chat_store.services.message_service import MessageService
-from chat_store.core.rate_limiter import limiter
+from chat_store.core.rate_limiter import limiter_strict, limiter_fast
 
 
 def get_session_repository(db: AsyncSession = Depends(get_db)) -> SessionRepository:
@@ -34,11 +34,12 @@ def get_message_service(
     return MessageService(message_repository, session_repository)
 
 
-# Export the limiter for use in endpoints
+# Export the limiters for use in endpoints
 __all__ = [
     "get_session_repository",
     "get_message_repository", 
     "get_session_service",
     "get_message_service",
-    "limiter"
+    "limiter_strict",
+    "limiter_fast",
 ]
\ No newline at end of file
@@ -1,16 +1,22 @@
-from datetime import datetime
+import logging
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
 
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.background import BackgroundTask
 
 from chat_store.api.v1.api import api_router
 from chat_store.core.config import config
 from chat_store.core.logger import setup_logging, get_logger
-from chat_store.core.middleware import LoggingMiddleware
-from chat_store.core.rate_limiter import setup_rate_limiter
-from chat_store.db.init_db import init_db
+from chat_store.core.middleware import ETagMiddleware, LoggingMiddleware
+from chat_store.core.rate_limiter import setup_rate_limiter, init_rate_limiter, close_rate_limiter
+from chat_store.db.init_db import close_db, init_db, warm_up_pool
 
 # Import models to ensure SQLAlchemy mapper configuration
 from chat_store.models import message, session  # noqa: F401
@@ -21,8 +27,12 @@ logger = get_logger(__name__)
 async def lifespan(app: FastAPI):
     setup_logging()
     await init_db()
+    await warm_up_pool()
+    await init_rate_limiter()
     logger.info("application_startup", service="chat-store", version="1.0.0")
     yield
+    await close_rate_limiter()
+    await close_db()
     logger.info("application_shutdown", service="chat-store")
 
 app = FastAPI(
@@ -30,12 +40,20 @@ app = FastAPI(
     description="A scalable backend microservice for managing chat sessions in a RAG chatbot system",
     version="1.0.0",
     openapi_url=f"{config.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # Setup rate limiting
 setup_rate_limiter(app)
 
+# Innermost, so the tag is computed over the uncompressed body
+app.add_middleware(ETagMiddleware)
+
+# Registered before LoggingMiddleware so it runs inside it and the logged
+# content_length reflects the compressed body
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(LoggingMiddleware)
 
 app.add_middleware(
@@ -49,47 +67,61 @@ app.add_middleware(
 app.include_router(api_router, prefix=config.API_V1_STR)
 
 start_time = datetime.now()
-
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Handle all unhandled exceptions globally."""
-    logger.error(
-        "unhandled_exception",
+start_time_iso = start_time.isoformat()
+# Monotonic, so uptime is immune to wall-clock adjustments
+_started = time.monotonic()
+# The stdlib logger backing `logger`, for cheap level checks
+_level_logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _format_uptime(seconds: int) -> str:
+    """Format whole seconds of uptime; probes within the same second reuse the string."""
+    days, remainder = divmod(seconds, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{days}d {hours}hrs {minutes}mins {seconds}s"
+
+@app.exception_handler(SQLAlchemyError)
+async def database_exception_handler(request: Request, exc: SQLAlchemyError):
+    """Turn database errors into a 500, logging the traceback after the response is sent.
+
+    HTTPExceptions keep Starlette's own handler, and any other unhandled
+    exception is answered by LoggingMiddleware.
+    """
+    log_error = BackgroundTask(
+        logger.error,
+        "database_error",
         error=str(exc),
+        error_type=type(exc).__name__,
         path=request.url.path,
         method=request.method,
-        exc_info=True
+        exc_info=exc,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
             "request_id": getattr(request.state, 'request_id', 'unknown')
-        }
+        },
+        background=log_error,
     )
 
 
 @app.get("/health")
 async def health():
     """A simple, fast liveness probe."""
-    current_time = datetime.now()
-    uptime = current_time - start_time
-
-    days = uptime.days
-    seconds = uptime.seconds
-    hours, remainder = divmod(seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
+    uptime = time.monotonic() - _started
 
-    uptime_str = f"{days}d {hours}hrs {minutes}mins {seconds}s"
+    if _level_logger.isEnabledFor(logging.DEBUG):
+        logger.debug("health_check_requested", uptime_seconds=uptime)
 
-    logger.debug("health_check_requested", uptime_seconds=uptime.total_seconds())
-
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "status": "OK",
-            "start_time": start_time.isoformat(),
-            "current_time": current_time.isoformat(),
-            "uptime": uptime_str,
+            "start_time": start_time_iso,
+            "current_time": datetime.now().isoformat(),
+            "uptime": _format_uptime(int(uptime)),
         },
         status_code=200
-    )
\ No newline at end of file
+    )
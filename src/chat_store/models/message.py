@@ -3,7 +3,7 @@ from enum import Enum
 from uuid import UUID
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Text, DateTime, ForeignKey, JSON, text
+from sqlalchemy import Index, Text, DateTime, ForeignKey, JSON, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from chat_store.db.base import Base, TimeStampMixin, UUIDMixin
 
@@ -25,14 +25,20 @@ class Sender(str, Enum):
 
 class Message(Base, TimeStampMixin, UUIDMixin):
     __tablename__ = "messages"
-
-    session_id: Mapped[UUID] = mapped_column(ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    __table_args__ = (
+        # Serves the per-session scans: history pages (read backwards), the
+        # latest message, and the resume lookup. Also covers plain
+        # session_id lookups, so session_id needs no index of its own.
+        Index("ix_messages_session_id_timestamp", "session_id", text("timestamp DESC")),
+    )
+
+    session_id: Mapped[UUID] = mapped_column(ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False)
     sender: Mapped[Sender] = mapped_column(default=Sender.USER, nullable=False, index=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     context: Mapped[dict] = mapped_column(JSON, nullable=True)
     status: Mapped[MessageStatus] = mapped_column(default=MessageStatus.PENDING, nullable=False, index=True)
     partial_content: Mapped[str] = mapped_column(Text, nullable=True)
     error_message: Mapped[str] = mapped_column(Text, nullable=True)
-    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=text("now()"), nullable=False, index=True)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
-    session: Mapped["Session"] = relationship(back_populates="messages", lazy="joined")
\ No newline at end of file
+    session: Mapped["Session"] = relationship(back_populates="messages", lazy="raise")
\ No newline at end of file
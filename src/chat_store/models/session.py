@@ -16,4 +16,12 @@ class Session(Base, TimeStampMixin, UUIDMixin):
     name: Mapped[str] = mapped_column(default="New Chat", nullable=False, index=True)
     is_favorite: Mapped[bool] = mapped_column(default=False, nullable=False, index=True)
 
-    messages: Mapped[list["Message"]] = relationship(back_populates="session", cascade="all, delete-orphan", lazy="joined")
\ No newline at end of file
+    # Never loaded implicitly: callers opt in per query (e.g. selectinload).
+    # passive_deletes leaves child rows to the ON DELETE CASCADE foreign key
+    # instead of loading them just to delete them.
+    messages: Mapped[list["Message"]] = relationship(
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
+    )
\ No newline at end of file
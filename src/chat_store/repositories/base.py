@@ -5,11 +5,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 T = TypeVar('T')
 
 class BaseRepository(ABC, Generic[T]):
-    """Base repository interface for data access operations."""
+    """Base repository interface for data access operations.
+
+    Writes are only flushed; the service layer commits once per operation
+    through `commit`, and a session closed without committing rolls back.
+    """
     
     def __init__(self, db: AsyncSession):
         self.db = db
     
+    async def commit(self) -> None:
+        """Commit the unit of work shared by every repository on this session."""
+        await self.db.commit()
+    
     @abstractmethod
     async def create(self, obj: T) -> T:
         """Create a new entity."""
@@ -1,12 +1,18 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import delete, exists, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from chat_store.models.message import Message
+from chat_store.models.message import Message, MessageStatus
 from chat_store.repositories.base import BaseRepository
 
 
+# Attribute names update() may set; anything else in kwargs is ignored
+_MESSAGE_COLS = frozenset(attr.key for attr in Message.__mapper__.column_attrs)
+
+_RESUMABLE_STATUSES = (MessageStatus.PENDING, MessageStatus.FAILED)
+
+
 class MessageRepository(BaseRepository[Message]):
     """Repository for Message data access operations."""
     
@@ -16,10 +22,15 @@ class MessageRepository(BaseRepository[Message]):
     async def create(self, message: Message) -> Message:
         """Create a new message."""
         self.db.add(message)
-        await self.db.commit()
-        await self.db.refresh(message)
+        await self.db.flush()
         return message
     
+    async def bulk_create(self, messages: List[Message]) -> List[Message]:
+        """Create several messages; the flush sends them as one multi-row INSERT."""
+        self.db.add_all(messages)
+        await self.db.flush()
+        return messages
+    
     async def get_by_id(self, message_id: UUID) -> Optional[Message]:
         """Get message by ID."""
         result = await self.db.execute(
@@ -35,6 +46,29 @@ class MessageRepository(BaseRepository[Message]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def list_and_count_by_session(
+        self, session_id: UUID, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Message], int]:
+        """List a page of messages for a session together with the session's total.
+
+        The total rides along as a `count(*) OVER ()` column, so a non-empty
+        page costs one round-trip. A page past the end has no rows to carry
+        it and falls back to `count_by_session`.
+        """
+        query = (
+            select(Message, func.count().over().label("total"))
+            .where(Message.session_id == session_id)
+            .order_by(Message.timestamp.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            total = await self.count_by_session(session_id) if skip else 0
+            return [], total
+        return [row.Message for row in rows], rows[0].total
+    
     async def count_by_session(self, session_id: UUID) -> int:
         """Count total messages for a session."""
         query = select(func.count()).where(Message.session_id == session_id)
@@ -52,6 +86,28 @@ class MessageRepository(BaseRepository[Message]):
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
+    async def resume_latest_by_session(self, session_id: UUID) -> Optional[Tuple[UUID, MessageStatus]]:
+        """Reset the session's latest message to pending if it is pending or failed.
+
+        Returns the message's (id, status), or None when the session has no
+        messages or its latest one is not resumable.
+        """
+        latest_id = (
+            select(Message.id)
+            .where(Message.session_id == session_id)
+            .order_by(Message.timestamp.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Message)
+            .where(Message.id == latest_id, Message.status.in_(_RESUMABLE_STATUSES))
+            .values(status=MessageStatus.PENDING, error_message=None)
+            .returning(Message.id, Message.status)
+        )
+        row = (await self.db.execute(stmt)).one_or_none()
+        return (row.id, row.status) if row else None
+    
     async def list(self, **filters) -> List[Message]:
         """List messages with optional filters."""
         query = select(Message)
@@ -67,35 +123,41 @@ class MessageRepository(BaseRepository[Message]):
         return list(result.scalars().all())
     
     async def update(self, message_id: UUID, **kwargs) -> Optional[Message]:
-        """Update message by ID."""
-        message = await self.get_by_id(message_id)
-        if message:
-            for key, value in kwargs.items():
-                if hasattr(message, key):
-                    setattr(message, key, value)
-            await self.db.commit()
-            await self.db.refresh(message)
-        return message
+        """Update message by ID in a single UPDATE ... RETURNING round-trip."""
+        values = {key: value for key, value in kwargs.items() if key in _MESSAGE_COLS}
+        if not values:
+            return await self.get_by_id(message_id)
+
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(**values)
+            .returning(Message)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
+    
+    async def update_status(
+        self, message_id: UUID, status: MessageStatus, error_message: Optional[str] = None
+    ) -> Optional[Tuple[UUID, MessageStatus]]:
+        """Set a message's status and return its (id, status) without loading the row."""
+        stmt = (
+            update(Message)
+            .where(Message.id == message_id)
+            .values(status=status, error_message=error_message)
+            .returning(Message.id, Message.status)
+        )
+        row = (await self.db.execute(stmt)).one_or_none()
+        return (row.id, row.status) if row else None
     
     async def delete(self, message_id: UUID) -> bool:
-        """Delete message by ID."""
-        message = await self.get_by_id(message_id)
-        if message:
-            await self.db.delete(message)
-            await self.db.commit()
-            return True
-        return False
+        """Delete message by ID in a single DELETE ... RETURNING round-trip."""
+        stmt = delete(Message).where(Message.id == message_id).returning(Message.id)
+        return (await self.db.execute(stmt)).scalar_one_or_none() is not None
     
     async def exists(self, message_id: UUID) -> bool:
         """Check if message exists."""
-        result = await self.db.execute(
-            select(Message.id).where(Message.id == message_id)
-        )
-        return result.scalar_one_or_none() is not None
+        return bool(await self.db.scalar(select(exists().where(Message.id == message_id))))
     
     async def exists_in_session(self, session_id: UUID) -> bool:
         """Check if any messages exist for a session."""
-        result = await self.db.execute(
-            select(Message.id).where(Message.session_id == session_id).limit(1)
-        )
-        return result.scalar_one_or_none() is not None
\ No newline at end of file
+        return bool(await self.db.scalar(select(exists().where(Message.session_id == session_id))))
\ No newline at end of file
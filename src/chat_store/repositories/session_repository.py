@@ -1,12 +1,17 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import delete, exists, select, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from chat_store.models.session import Session
 from chat_store.repositories.base import BaseRepository
 
 
+# Attribute names update() may set; anything else in kwargs is ignored
+_SESSION_COLS = frozenset(attr.key for attr in Session.__mapper__.column_attrs)
+
+
 class SessionRepository(BaseRepository[Session]):
     """Repository for Session data access operations."""
     
@@ -16,10 +21,15 @@ class SessionRepository(BaseRepository[Session]):
     async def create(self, session: Session) -> Session:
         """Create a new session."""
         self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
+        await self.db.flush()
         return session
     
+    async def bulk_create(self, sessions: List[Session]) -> List[Session]:
+        """Create several sessions; the flush sends them as one multi-row INSERT."""
+        self.db.add_all(sessions)
+        await self.db.flush()
+        return sessions
+    
     async def get_by_id(self, session_id: UUID) -> Optional[Session]:
         """Get session by ID."""
         result = await self.db.execute(
@@ -38,6 +48,47 @@ class SessionRepository(BaseRepository[Session]):
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def list_by_user_with_messages(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Session]:
+        """List a user's sessions with their messages loaded.
+
+        Messages for the whole page are fetched in one extra
+        `WHERE session_id IN (...)` query, however many sessions it holds.
+        """
+        query = (
+            select(Session)
+            .where(Session.user_id == user_id)
+            .options(selectinload(Session.messages))
+            .order_by(Session.is_favorite.desc(), Session.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def list_and_count_by_user(
+        self, user_id: UUID, skip: int = 0, limit: int = 100
+    ) -> Tuple[List[Session], int]:
+        """List a page of sessions for a user together with the user's total.
+
+        The total rides along as a `count(*) OVER ()` column, so a non-empty
+        page costs one round-trip. A page past the end has no rows to carry
+        it and falls back to `count_by_user`.
+        """
+        query = (
+            select(Session, func.count().over().label("total"))
+            .where(Session.user_id == user_id)
+            .order_by(Session.is_favorite.desc(), Session.updated_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            total = await self.count_by_user(user_id) if skip else 0
+            return [], total
+        return [row.Session for row in rows], rows[0].total
+    
     async def count_by_user(self, user_id: UUID) -> int:
         """Count total sessions for a user."""
         query = select(func.count()).where(Session.user_id == user_id)
@@ -56,28 +107,25 @@ class SessionRepository(BaseRepository[Session]):
         return list(result.scalars().all())
     
     async def update(self, session_id: UUID, **kwargs) -> Optional[Session]:
-        """Update session by ID."""
-        session = await self.get_by_id(session_id)
-        if session:
-            for key, value in kwargs.items():
-                if hasattr(session, key):
-                    setattr(session, key, value)
-            await self.db.commit()
-            await self.db.refresh(session)
-        return session
+        """Update session by ID in a single UPDATE ... RETURNING round-trip."""
+        values = {key: value for key, value in kwargs.items() if key in _SESSION_COLS}
+        if not values:
+            return await self.get_by_id(session_id)
+
+        stmt = (
+            update(Session)
+            .where(Session.id == session_id)
+            .values(**values)
+            .returning(Session)
+        )
+        return (await self.db.execute(stmt)).scalar_one_or_none()
     
     async def delete(self, session_id: UUID) -> bool:
-        """Delete session by ID."""
-        session = await self.get_by_id(session_id)
-        if session:
-            await self.db.delete(session)
-            await self.db.commit()
-            return True
-        return False
+        """Delete session by ID in a single DELETE ... RETURNING round-trip."""
+        # Messages go with it through the ON DELETE CASCADE foreign key
+        stmt = delete(Session).where(Session.id == session_id).returning(Session.id)
+        return (await self.db.execute(stmt)).scalar_one_or_none() is not None
     
     async def exists(self, session_id: UUID) -> bool:
         """Check if session exists."""
-        result = await self.db.execute(
-            select(Session.id).where(Session.id == session_id)
-        )
-        return result.scalar_one_or_none() is not None
\ No newline at end of file
+        return bool(await self.db.scalar(select(exists().where(Session.id == session_id))))
\ No newline at end of file
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, Any, Dict
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field
 
 from chat_store.models.message import MessageStatus, Sender
 
@@ -24,6 +24,8 @@ class MessageUpdate(BaseModel):
 
 
 class MessageInDBBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     session_id: UUID
     sender: Sender
@@ -36,26 +38,6 @@ class MessageInDBBase(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_serializer('id')
-    def serialize_id(self, value: UUID, _info) -> str:
-        return str(value)
-
-    @field_serializer('session_id')
-    def serialize_session_id(self, value: UUID, _info) -> str:
-        return str(value)
-
-    @field_serializer('timestamp')
-    def serialize_timestamp(self, value: datetime, _info) -> str:
-        return value.isoformat()
-
-    @field_serializer('created_at')
-    def serialize_created_at(self, value: datetime, _info) -> str:
-        return value.isoformat()
-
-    @field_serializer('updated_at')
-    def serialize_updated_at(self, value: datetime, _info) -> str:
-        return value.isoformat()
-
 
 class Message(MessageInDBBase):
     pass
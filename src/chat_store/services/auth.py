@@ -1,5 +1,5 @@
 import secrets
-from fastapi import HTTPException, Security, status
+from fastapi import HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from chat_store.core.config import config
@@ -9,15 +9,21 @@ security = HTTPBearer()
 
 
 async def verify_api_key(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Security(security)
 ) -> str:
-    """Verify API key from Authorization header."""
+    """Verify API key from Authorization header, once per request."""
+    cached = getattr(request.state, "api_key", None)
+    if cached is not None:
+        return cached
+
     if not secrets.compare_digest(credentials.credentials, config.auth.API_KEY):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    request.state.api_key = credentials.credentials
     return credentials.credentials
 
 
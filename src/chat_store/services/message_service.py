@@ -1,6 +1,8 @@
-from typing import List, Optional, Tuple
+from typing import List, NoReturn, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+
 from chat_store.repositories.message_repository import MessageRepository
 from chat_store.repositories.session_repository import SessionRepository
 from chat_store.models.message import Message, MessageStatus
@@ -9,6 +11,10 @@ from chat_store.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# MessageCreate fields copied onto the ORM row. Only the ones the client sent
+# are copied, so an omitted `context` stays SQL NULL rather than JSON null.
+_MSG_FIELDS = ("sender", "content", "context")
+
 
 class MessageService:
     """Service layer for message business logic."""
@@ -18,27 +24,29 @@ class MessageService:
         self.session_repository = session_repository
     
     async def create_message(self, session_id: UUID, message_data: MessageCreate) -> Message:
-        """Create a new message with session validation."""
-        # Validate session exists
-        session_exists = await self.session_repository.exists(session_id)
-        if not session_exists:
+        """Create a new message; the session foreign key rejects unknown sessions."""
+        fields_set = message_data.model_fields_set
+        message = Message(
+            session_id=session_id,
+            **{field: getattr(message_data, field) for field in _MSG_FIELDS if field in fields_set},
+        )
+        try:
+            created_message = await self.message_repository.create(message)
+        except IntegrityError:
+            # The messages.session_id foreign key rejects unknown sessions
             logger.warning(
                 "session_not_found",
                 session_id=str(session_id),
                 action="create_message"
             )
             raise ValueError(f"Session {session_id} not found")
-        
-        message_data_dict = message_data.model_dump(exclude_unset=True)
-        message_data_dict['session_id'] = session_id
-        message = Message(**message_data_dict)
-        created_message = await self.message_repository.create(message)
+        await self.message_repository.commit()
         
         logger.info(
             "message_created",
             message_id=str(created_message.id),
             session_id=str(created_message.session_id),
-            sender=created_message.sender.value,
+            sender=created_message.sender,
             content_length=len(created_message.content)
         )
         
@@ -46,9 +54,12 @@ class MessageService:
     
     async def get_session_messages(self, session_id: UUID, skip: int = 0, limit: int = 100) -> Tuple[List[Message], int]:
         """Get paginated messages for a session."""
-        # Validate session exists
-        session_exists = await self.session_repository.exists(session_id)
-        if not session_exists:
+        messages, total = await self.message_repository.list_and_count_by_session(session_id, skip, limit)
+
+        # Only an empty page needs to tell "no messages" apart from "no session".
+        # Always ask the database: the session may have been deleted by
+        # another worker, and this path is already off the fast one.
+        if not messages and not await self.session_repository.exists(session_id):
             logger.warning(
                 "session_not_found",
                 session_id=str(session_id),
@@ -56,9 +67,6 @@ class MessageService:
             )
             raise ValueError(f"Session {session_id} not found")
         
-        messages = await self.message_repository.list_by_session(session_id, skip, limit)
-        total = await self.message_repository.count_by_session(session_id)
-        
         logger.debug(
             "session_messages_retrieved",
             session_id=str(session_id),
@@ -83,9 +91,26 @@ class MessageService:
     
     async def resume_failed_message(self, session_id: UUID) -> ResumeResponse:
         """Resume a failed or pending message."""
-        # Validate session exists
-        session_exists = await self.session_repository.exists(session_id)
-        if not session_exists:
+        resumed = await self.message_repository.resume_latest_by_session(session_id)
+        
+        if resumed is None:
+            # Only a refused resume needs the extra lookups to explain why
+            await self._raise_not_resumable(session_id)
+        
+        await self.message_repository.commit()
+        message_id, message_status = resumed
+        
+        logger.info(
+            "message_resumed",
+            session_id=str(session_id),
+            message_id=str(message_id)
+        )
+        
+        return ResumeResponse(message_id=message_id, status=message_status)
+    
+    async def _raise_not_resumable(self, session_id: UUID) -> NoReturn:
+        """Raise the ValueError describing why the session has nothing to resume."""
+        if not await self.session_repository.exists(session_id):
             logger.warning(
                 "session_not_found",
                 session_id=str(session_id),
@@ -93,7 +118,6 @@ class MessageService:
             )
             raise ValueError(f"Session {session_id} not found")
         
-        # Get the latest message
         latest_message = await self.message_repository.get_latest_by_session(session_id)
         
         if not latest_message:
@@ -104,58 +128,35 @@ class MessageService:
             )
             raise ValueError(f"No messages found for session {session_id}")
         
-        # Check if message is resumable
-        if latest_message.status not in [MessageStatus.PENDING, MessageStatus.FAILED]:
-            logger.warning(
-                "message_not_resumable",
-                session_id=str(session_id),
-                message_id=str(latest_message.id),
-                status=latest_message.status.value
-            )
-            raise ValueError("Latest message is not in a resumable state")
-        
-        # Reset status to pending
-        updated_message = await self.message_repository.update(
-            latest_message.id,
-            status=MessageStatus.PENDING,
-            error_message=None
-        )
-        
-        if updated_message:
-            logger.info(
-                "message_resumed",
-                session_id=str(session_id),
-                message_id=str(updated_message.id)
-            )
-        
-        return ResumeResponse(
-            message_id=updated_message.id,
-            status=updated_message.status
+        logger.warning(
+            "message_not_resumable",
+            session_id=str(session_id),
+            message_id=str(latest_message.id),
+            status=latest_message.status
         )
+        raise ValueError("Latest message is not in a resumable state")
     
-    async def update_message_status(self, message_id: UUID, status: MessageStatus, error_message: Optional[str] = None) -> Optional[Message]:
-        """Update message status."""
-        updated_message = await self.message_repository.update(
-            message_id,
-            status=status,
-            error_message=error_message
-        )
+    async def update_message_status(self, message_id: UUID, status: MessageStatus, error_message: Optional[str] = None) -> Optional[Tuple[UUID, MessageStatus]]:
+        """Update message status; returns (id, status) or None if the message does not exist."""
+        updated = await self.message_repository.update_status(message_id, status, error_message)
         
-        if updated_message:
+        if updated:
+            await self.message_repository.commit()
             logger.info(
                 "message_status_updated",
                 message_id=str(message_id),
-                status=status.value,
+                status=status,
                 error_message=error_message
             )
         
-        return updated_message
+        return updated
     
     async def delete_message(self, message_id: UUID) -> bool:
         """Delete a message."""
         success = await self.message_repository.delete(message_id)
         
         if success:
+            await self.message_repository.commit()
             logger.info("message_deleted", message_id=str(message_id))
         else:
             logger.warning("message_delete_failed", message_id=str(message_id))
@@ -17,8 +17,9 @@ class SessionService:
     
     async def create_session(self, session_data: SessionCreate) -> Session:
         """Create a new session with business validation."""
-        session = Session(**session_data.dict())
+        session = Session(**session_data.model_dump(exclude_unset=True))
         created_session = await self.repository.create(session)
+        await self.repository.commit()
         
         logger.info(
             "session_created",
@@ -31,8 +32,7 @@ class SessionService:
     
     async def get_user_sessions(self, user_id: UUID, skip: int = 0, limit: int = 100) -> Tuple[List[Session], int]:
         """Get paginated sessions for a user."""
-        sessions = await self.repository.list_by_user(user_id, skip, limit)
-        total = await self.repository.count_by_user(user_id)
+        sessions, total = await self.repository.list_and_count_by_user(user_id, skip, limit)
         
         logger.debug(
             "user_sessions_retrieved",
@@ -65,6 +65,7 @@ class SessionService:
         updated_session = await self.repository.update(session_id, name=name.strip())
         
         if updated_session:
+            await self.repository.commit()
             logger.info(
                 "session_name_updated",
                 session_id=str(session_id),
@@ -78,6 +79,7 @@ class SessionService:
         updated_session = await self.repository.update(session_id, is_favorite=is_favorite)
         
         if updated_session:
+            await self.repository.commit()
             logger.info(
                 "session_favorite_toggled",
                 session_id=str(session_id),
@@ -91,6 +93,7 @@ class SessionService:
         success = await self.repository.delete(session_id)
         
         if success:
+            await self.repository.commit()
             logger.info("session_deleted", session_id=str(session_id))
         else:
             logger.warning("session_delete_failed", session_id=str(session_id))
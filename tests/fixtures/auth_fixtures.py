@@ -46,26 +46,3 @@ def missing_auth_headers():
     """Missing authorization headers."""
     return {}
 
-
-@pytest.fixture
-def sample_user_id():
-    """Sample user ID for testing."""
-    return "test-user-123e4567-e89b-12d3-a456-426614174000"
-
-
-@pytest.fixture
-def sample_user_id_2():
-    """Second sample user ID for testing."""
-    return "test-user-987e6543-e21b-12d3-a456-426614174001"
-
-
-@pytest.fixture
-def sample_session_id():
-    """Sample session ID for testing."""
-    return "test-session-123e4567-e89b-12d3-a456-426614174000"
-
-
-@pytest.fixture
-def sample_message_id():
-    """Sample message ID for testing."""
-    return "test-message-123e4567-e89b-12d3-a456-426614174000"
\ No newline at end of file
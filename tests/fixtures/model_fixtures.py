@@ -1,231 +1,238 @@
 """
 Model fixtures for testing.
 """
+import itertools
+from types import MappingProxyType
+from typing import Optional
+
 import pytest
 import pytest_asyncio
 from uuid import uuid4
 from datetime import datetime, timezone
 
+from sqlalchemy import insert
+
 from chat_store.models.session import Session
 from chat_store.models.message import Message, MessageStatus, Sender
 
 
-@pytest.fixture
+# Every test's writes are rolled back, so the sample ids can be drawn once
+# per run and shared.
+@pytest.fixture(scope="session")
 def sample_user_id():
     """Sample user ID for testing."""
-    return str(uuid4())
+    return uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_user_id_2():
+    """Second sample user ID for testing."""
+    return uuid4()
+
+
+@pytest.fixture(scope="session")
 def sample_session_id():
     """Sample session ID for testing."""
     return uuid4()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_message_id():
     """Sample message ID for testing."""
     return uuid4()
 
 
-@pytest.fixture
+# Read-only templates shared by every test; copy with dict(...) to modify
+_SAMPLE_MESSAGE = MappingProxyType({
+    "sender": Sender.USER,
+    "content": "Hello, this is a test message",
+    "context": {"test": True}
+})
+
+_SAMPLE_AI_MESSAGE = MappingProxyType({
+    "sender": Sender.AI,
+    "content": "Hello! How can I help you today?",
+    "context": {"type": "ai_response"}
+})
+
+_SAMPLE_MESSAGE_WITH_STATUS = MappingProxyType({
+    "sender": Sender.USER,
+    "content": "Test message with status",
+    "status": MessageStatus.COMPLETE,
+    "context": {"priority": "high"}
+})
+
+
+@pytest.fixture(scope="session")
 def sample_session_data(sample_user_id):
     """Sample session data for testing."""
-    return {
+    return MappingProxyType({
         "user_id": sample_user_id,
         "name": "Test Chat Session",
         "is_favorite": False
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_session_data_with_favorite(sample_user_id):
     """Sample session data with favorite flag."""
-    return {
+    return MappingProxyType({
         "user_id": sample_user_id,
         "name": "Favorite Chat Session",
         "is_favorite": True
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_message_data():
     """Sample message data for testing."""
-    return {
-        "sender": Sender.USER,
-        "content": "Hello, this is a test message",
-        "context": {"test": True}
-    }
+    return _SAMPLE_MESSAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ai_message_data():
     """Sample AI message data for testing."""
-    return {
-        "sender": Sender.AI,
-        "content": "Hello! How can I help you today?",
-        "context": {"type": "ai_response"}
-    }
+    return _SAMPLE_AI_MESSAGE
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_message_data_with_status():
     """Sample message data with specific status."""
-    return {
-        "sender": Sender.USER,
-        "content": "Test message with status",
-        "status": MessageStatus.COMPLETE,
-        "context": {"priority": "high"}
-    }
+    return _SAMPLE_MESSAGE_WITH_STATUS
 
 
 @pytest_asyncio.fixture
 async def test_session(db_session, sample_user_id) -> Session:
     """Create a test session."""
-    session = Session(
-        user_id=sample_user_id,
-        name="Test Session",
-        is_favorite=False
+    session = await db_session.scalar(
+        insert(Session)
+        .values(user_id=sample_user_id, name="Test Session", is_favorite=False)
+        .returning(Session)
     )
-    db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return session
 
 
 @pytest_asyncio.fixture
 async def test_favorite_session(db_session, sample_user_id) -> Session:
     """Create a test favorite session."""
-    session = Session(
-        user_id=sample_user_id,
-        name="Favorite Test Session",
-        is_favorite=True
+    session = await db_session.scalar(
+        insert(Session)
+        .values(user_id=sample_user_id, name="Favorite Test Session", is_favorite=True)
+        .returning(Session)
     )
-    db_session.add(session)
     await db_session.commit()
-    await db_session.refresh(session)
     return session
 
 
 @pytest_asyncio.fixture
 async def test_sessions_bulk(db_session, sample_user_id) -> list[Session]:
     """Create multiple test sessions for bulk operations."""
-    sessions = []
-    for i in range(5):
-        session = Session(
-            user_id=sample_user_id,
-            name=f"Test Session {i+1}",
-            is_favorite=(i % 2 == 0)
-        )
-        sessions.append(session)
-        db_session.add(session)
+    rows = [
+        {
+            "user_id": sample_user_id,
+            "name": f"Test Session {i+1}",
+            "is_favorite": (i % 2 == 0),
+        }
+        for i in range(5)
+    ]
     
+    # One INSERT ... RETURNING brings back the server defaults with the rows
+    result = await db_session.scalars(
+        insert(Session).returning(Session, sort_by_parameter_order=True), rows
+    )
+    sessions = list(result)
     await db_session.commit()
-    
-    for session in sessions:
-        await db_session.refresh(session)
-    
     return sessions
 
 
 @pytest_asyncio.fixture
 async def test_message(db_session, test_session) -> Message:
     """Create a test message."""
-    message = Message(
-        session_id=test_session.id,
-        sender=Sender.USER,
-        content="Test message content",
-        context={"test": True}
+    message = await db_session.scalar(
+        insert(Message)
+        .values(
+            session_id=test_session.id,
+            sender=Sender.USER,
+            content="Test message content",
+            context={"test": True},
+        )
+        .returning(Message)
     )
-    db_session.add(message)
     await db_session.commit()
-    await db_session.refresh(message)
     return message
 
 
 @pytest_asyncio.fixture
-async def test_messages_bulk(db_session, test_session) -> list[Message]:
-    """Create multiple test messages for bulk operations."""
-    messages = []
-    
-    # Create user message
-    user_msg = Message(
-        session_id=test_session.id,
-        sender=Sender.USER,
-        content="Hello, this is a user message",
-        context={"type": "user_input"}
-    )
-    messages.append(user_msg)
-    
-    # Create AI message
-    ai_msg = Message(
-        session_id=test_session.id,
-        sender=Sender.AI,
-        content="Hello! How can I help you today?",
-        context={"type": "ai_response"}
-    )
-    messages.append(ai_msg)
-    
-    # Create additional messages
-    for i in range(3):
-        msg = Message(
-            session_id=test_session.id,
-            sender=Sender.USER if i % 2 == 0 else Sender.AI,
-            content=f"Message {i+1}",
-            context={"sequence": i+1}
+async def message_factory(db_session, test_session):
+    """Return a callable that inserts only the messages a test asks for.
+
+    ``await message_factory(n)`` inserts ``n`` messages alternating between
+    user and AI senders; pass ``statuses`` to give each message a status
+    (``n`` defaults to its length). Extra keyword arguments are applied to
+    every row.
+    """
+    async def _make(n: Optional[int] = None, statuses: Optional[list[MessageStatus]] = None, **overrides) -> list[Message]:
+        if n is None:
+            n = len(statuses) if statuses else 2
+        senders = itertools.cycle((Sender.USER, Sender.AI))
+        rows = [
+            {
+                "session_id": test_session.id,
+                "sender": next(senders),
+                "content": f"Message {i+1}",
+                "context": {"sequence": i+1},
+                **overrides,
+            }
+            for i in range(n)
+        ]
+        if statuses:
+            for row, status in zip(rows, statuses):
+                row["status"] = status
+        
+        # One INSERT ... RETURNING brings back the server defaults with the rows
+        result = await db_session.scalars(
+            insert(Message).returning(Message, sort_by_parameter_order=True), rows
         )
-        messages.append(msg)
+        messages = list(result)
+        await db_session.commit()
+        return messages
     
-    db_session.add_all(messages)
-    await db_session.commit()
-    
-    for msg in messages:
-        await db_session.refresh(msg)
-    
-    return messages
+    return _make
 
 
 @pytest_asyncio.fixture
-async def test_messages_different_statuses(db_session, test_session) -> list[Message]:
+async def test_messages_bulk(message_factory) -> list[Message]:
+    """Create multiple test messages for bulk operations."""
+    return await message_factory(5)
+
+
+@pytest_asyncio.fixture
+async def test_messages_different_statuses(message_factory) -> list[Message]:
     """Create test messages with different statuses."""
-    messages = []
-    statuses = [MessageStatus.PENDING, MessageStatus.IN_PROGRESS, MessageStatus.COMPLETE, MessageStatus.FAILED]
-    
-    for i, status in enumerate(statuses):
-        msg = Message(
-            session_id=test_session.id,
-            sender=Sender.AI if i % 2 == 0 else Sender.USER,
-            content=f"Message with status {status.value}",
-            status=status,
-            context={"status": status.value}
-        )
-        messages.append(msg)
-        db_session.add(msg)
-    
-    await db_session.commit()
-    
-    for msg in messages:
-        await db_session.refresh(msg)
-    
-    return messages
+    return await message_factory(
+        statuses=[MessageStatus.PENDING, MessageStatus.IN_PROGRESS, MessageStatus.COMPLETE, MessageStatus.FAILED]
+    )
 
 
 @pytest.fixture
 def session_model_dict(sample_user_id):
     """Dictionary representation of a session model."""
+    now = datetime.now(timezone.utc)
     return {
         "id": uuid4(),
         "user_id": sample_user_id,
         "name": "Test Session",
         "is_favorite": False,
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+        "created_at": now,
+        "updated_at": now,
     }
 
 
 @pytest.fixture
 def message_model_dict(sample_session_id):
     """Dictionary representation of a message model."""
+    now = datetime.now(timezone.utc)
     return {
         "id": uuid4(),
         "session_id": sample_session_id,
@@ -233,6 +240,6 @@ def message_model_dict(sample_session_id):
         "content": "Test message",
         "status": MessageStatus.PENDING,
         "context": {"test": True},
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+        "created_at": now,
+        "updated_at": now,
     }
\ No newline at end of file
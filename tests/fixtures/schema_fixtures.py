@@ -1,8 +1,10 @@
 """
 Schema fixtures for testing.
 """
+import itertools
+import os
 import pytest
-from uuid import uuid4
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
 from chat_store.schemas.session import SessionCreate, SessionUpdate, Session as SessionSchema
@@ -10,6 +12,21 @@ from chat_store.schemas.message import MessageCreate, Message as MessageSchema
 from chat_store.models.message import Sender, MessageStatus
 
 
+# Schema dicts only need a well-formed timestamp, so format one per run
+_NOW_ISO = datetime.now(timezone.utc).isoformat()
+
+# Serialized enum values, bound once for the dict fixtures below
+_USER_V, _AI_V = Sender.USER.value, Sender.AI.value
+_PENDING_V = MessageStatus.PENDING.value
+_COMPLETE_V = MessageStatus.COMPLETE.value
+
+
+def _uuid_strs(count: int) -> list[str]:
+    """Return `count` random UUID4 strings drawn from a single urandom call."""
+    raw = os.urandom(16 * count)
+    return [str(UUID(bytes=raw[i * 16:(i + 1) * 16], version=4)) for i in range(count)]
+
+
 @pytest.fixture
 def session_create_data():
     """Valid session creation data."""
@@ -77,31 +94,33 @@ def message_create_minimal_data():
 @pytest.fixture
 def session_schema_dict():
     """Dictionary representation of session schema."""
+    session_id, user_id = _uuid_strs(2)
     return {
-        "id": str(uuid4()),
-        "user_id": str(uuid4()),
+        "id": session_id,
+        "user_id": user_id,
         "name": "Test Session",
         "is_favorite": False,
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": _NOW_ISO,
+        "updated_at": _NOW_ISO,
     }
 
 
 @pytest.fixture
 def message_schema_dict():
     """Dictionary representation of message schema."""
+    message_id, session_id = _uuid_strs(2)
     return {
-        "id": str(uuid4()),
-        "session_id": str(uuid4()),
-        "sender": Sender.USER.value,
+        "id": message_id,
+        "session_id": session_id,
+        "sender": _USER_V,
         "content": "Test message content",
         "context": {"test": True},
-        "status": MessageStatus.PENDING.value,
+        "status": _PENDING_V,
         "partial_content": None,
         "error_message": None,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _NOW_ISO,
+        "created_at": _NOW_ISO,
+        "updated_at": _NOW_ISO,
     }
 
 
@@ -126,36 +145,38 @@ def message_create_schema(message_create_data):
 @pytest.fixture
 def session_schema_list():
     """List of session schemas for testing pagination."""
-    sessions = []
-    for i in range(5):
-        sessions.append({
-            "id": str(uuid4()),
-            "user_id": str(uuid4()),
+    ids = _uuid_strs(10)
+    return [
+        {
+            "id": ids[2 * i],
+            "user_id": ids[2 * i + 1],
             "name": f"Test Session {i+1}",
             "is_favorite": i % 2 == 0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        })
-    return sessions
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO,
+        }
+        for i in range(5)
+    ]
 
 
 @pytest.fixture
 def message_schema_list():
     """List of message schemas for testing pagination."""
-    messages = []
-    session_id = str(uuid4())
-    for i in range(10):
-        messages.append({
-            "id": str(uuid4()),
+    session_id, *ids = _uuid_strs(11)
+    senders = itertools.cycle((_USER_V, _AI_V))
+    return [
+        {
+            "id": ids[i],
             "session_id": session_id,
-            "sender": Sender.USER.value if i % 2 == 0 else Sender.AI.value,
+            "sender": next(senders),
             "content": f"Message {i+1}",
             "context": {"sequence": i+1},
-            "status": MessageStatus.COMPLETE.value,
+            "status": _COMPLETE_V,
             "partial_content": None,
             "error_message": None,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        })
-    return messages
\ No newline at end of file
+            "timestamp": _NOW_ISO,
+            "created_at": _NOW_ISO,
+            "updated_at": _NOW_ISO,
+        }
+        for i in range(10)
+    ]
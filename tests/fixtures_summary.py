@@ -5,61 +5,63 @@ This script provides a comprehensive overview of the fixtures available
 for testing the chat_store application.
 """
 
-print("=" * 60)
-print("CHAT_STORE TEST FIXTURES SUMMARY")
-print("=" * 60)
 
-print("\n📁 FIXTURE STRUCTURE:")
-print("tests/")
-print("├── fixtures/")
-print("│   ├── __init__.py           # Exports all fixtures")
-print("│   ├── database_fixtures.py  # Database and session fixtures")
-print("│   ├── model_fixtures.py     # Model instance fixtures")
-print("│   ├── schema_fixtures.py    # Schema validation fixtures")
-print("│   ├── auth_fixtures.py      # Authentication fixtures")
-print("│   └── README.md            # Detailed documentation")
-print("├── conftest.py              # Main pytest configuration")
-print("└── test_fixtures.py         # Fixture validation tests")
+def main():
+    """Print the fixture overview."""
+    print("=" * 60)
+    print("CHAT_STORE TEST FIXTURES SUMMARY")
+    print("=" * 60)
 
-print("\n🔧 DATABASE FIXTURES:")
-print("• event_loop          - Async event loop for tests")
-print("• db_engine          - Database engine for testing")
-print("• db_session         - Fresh database session per test")
-print("• override_get_db    - Dependency override for FastAPI")
-print("• client             - HTTP test client")
+    print("\n📁 FIXTURE STRUCTURE:")
+    print("tests/")
+    print("├── fixtures/")
+    print("│   ├── __init__.py           # Exports all fixtures")
+    print("│   ├── database_fixtures.py  # Database and session fixtures")
+    print("│   ├── model_fixtures.py     # Model instance fixtures")
+    print("│   ├── schema_fixtures.py    # Schema validation fixtures")
+    print("│   ├── auth_fixtures.py      # Authentication fixtures")
+    print("│   └── README.md            # Detailed documentation")
+    print("├── conftest.py              # Main pytest configuration")
+    print("└── test_fixtures.py         # Fixture validation tests")
 
-print("\n🎯 MODEL FIXTURES:")
-print("• sample_user_id     - UUID string for testing")
-print("• sample_session_id  - UUID for session testing")
-print("• sample_message_id  - UUID for message testing")
-print("• sample_session_data - Basic session data dict")
-print("• sample_message_data - Basic message data dict")
-print("• test_session       - Actual Session model instance")
-print("• test_favorite_session - Session with is_favorite=True")
-print("• test_sessions_bulk - List of 5 test sessions")
-print("• test_message       - Actual Message model instance")
-print("• test_messages_bulk - List of test messages")
-print("• test_messages_different_statuses - Messages with all status types")
+    print("\n🔧 DATABASE FIXTURES:")
+    print("• db_engine          - Database engine for testing")
+    print("• db_session         - Fresh database session per test")
+    print("• override_get_db    - Dependency override for FastAPI")
+    print("• client             - HTTP test client")
 
-print("\n📋 SCHEMA FIXTURES:")
-print("• session_create_data      - Valid SessionCreate data")
-print("• session_create_minimal_data - Minimal required session data")
-print("• session_update_data      - Valid SessionUpdate data")
-print("• message_create_data      - Valid MessageCreate data")
-print("• message_create_ai_data   - AI message creation data")
-print("• session_create_schema    - SessionCreate schema instance")
-print("• message_create_schema    - MessageCreate schema instance")
+    print("\n🎯 MODEL FIXTURES:")
+    print("• sample_user_id     - UUID for user testing")
+    print("• sample_session_id  - UUID for session testing")
+    print("• sample_message_id  - UUID for message testing")
+    print("• sample_session_data - Basic session data dict")
+    print("• sample_message_data - Basic message data dict")
+    print("• test_session       - Actual Session model instance")
+    print("• test_favorite_session - Session with is_favorite=True")
+    print("• test_sessions_bulk - List of 5 test sessions")
+    print("• test_message       - Actual Message model instance")
+    print("• test_messages_bulk - List of test messages")
+    print("• test_messages_different_statuses - Messages with all status types")
 
-print("\n🔐 AUTH FIXTURES:")
-print("• valid_api_key        - Valid API key from config")
-print("• invalid_api_key      - Invalid API key for testing")
-print("• auth_headers         - Valid authorization headers")
-print("• invalid_auth_headers - Invalid authorization headers")
-print("• malformed_auth_headers - Malformed auth headers")
-print("• missing_auth_headers - Empty headers dict")
+    print("\n📋 SCHEMA FIXTURES:")
+    print("• session_create_data      - Valid SessionCreate data")
+    print("• session_create_minimal_data - Minimal required session data")
+    print("• session_update_data      - Valid SessionUpdate data")
+    print("• message_create_data      - Valid MessageCreate data")
+    print("• message_create_ai_data   - AI message creation data")
+    print("• session_create_schema    - SessionCreate schema instance")
+    print("• message_create_schema    - MessageCreate schema instance")
 
-print("\n📖 USAGE EXAMPLES:")
-print("""
+    print("\n🔐 AUTH FIXTURES:")
+    print("• valid_api_key        - Valid API key from config")
+    print("• invalid_api_key      - Invalid API key for testing")
+    print("• auth_headers         - Valid authorization headers")
+    print("• invalid_auth_headers - Invalid authorization headers")
+    print("• malformed_auth_headers - Malformed auth headers")
+    print("• missing_auth_headers - Empty headers dict")
+
+    print("\n📖 USAGE EXAMPLES:")
+    print("""
 # Basic test with database
 @pytest.mark.asyncio
 async def test_create_session(db_session, sample_session_data):
@@ -90,11 +92,15 @@ async def test_list_sessions_pagination(client, auth_headers, test_sessions_bulk
     assert len(data["sessions"]) == 2
 """)
 
-print("\n🚀 RUNNING TESTS:")
-print("pytest                          # Run all tests")
-print("pytest tests/test_fixtures.py   # Test fixtures only")
-print("pytest -v                       # Verbose output")
-print("pytest --cov=src/chat_store     # With coverage")
+    print("\n🚀 RUNNING TESTS:")
+    print("pytest                          # Run all tests")
+    print("pytest tests/test_fixtures.py   # Test fixtures only")
+    print("pytest -v                       # Verbose output")
+    print("pytest --cov=src/chat_store     # With coverage")
+
+    print("\n✅ FIXTURES CREATED SUCCESSFULLY!")
+    print("=" * 60)
+
 
-print("\n✅ FIXTURES CREATED SUCCESSFULLY!")
-print("=" * 60)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -47,9 +47,9 @@ class TestFixtures:
         """Test that UUID fixtures are valid."""
         # Check if they can be converted to UUID
         try:
-            UUID(sample_user_id)
-            UUID(sample_session_id)
-            UUID(sample_message_id)
+            UUID(str(sample_user_id))
+            UUID(str(sample_session_id))
+            UUID(str(sample_message_id))
             assert True
         except ValueError:
             pytest.fail("Invalid UUID format in fixtures")
@@ -1,83 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test script to verify rate limiting implementation.
-"""
-import sys
-import os
-
-# Add the src directory to the path
-sys.path.insert(0, '/home/shefeek/Desktop/Projects/chat_store/src')
-
-# Set environment variables for testing
-os.environ['RATE_LIMITER_ENABLED'] = 'true'
-os.environ['REDIS_HOST'] = 'localhost'
-os.environ['REDIS_PORT'] = '6379'
-os.environ['REDIS_PASSWORD'] = 'redis'
-
-from chat_store.core.config import config
-from chat_store.core.rate_limiter import get_rate_limit_string
-
-def test_rate_limiting_config():
-    """Test rate limiting configuration."""
-    print("=== Testing Rate Limiting Configuration ===")
-    
-    # Test configuration values
-    print(f"Rate limiter enabled: {config.RATE_LIMITER_ENABLED}")
-    print(f"Max requests: {config.RATE_LIMITER_MAX_REQUESTS}")
-    print(f"Timeframe: {config.RATE_LIMITER_TIMEFRAME} seconds")
-    
-    # Test rate limit strings
-    print(f"Create session limit: {get_rate_limit_string('create_session')}")
-    print(f"Create message limit: {get_rate_limit_string('create_message')}")
-    print(f"Get messages limit: {get_rate_limit_string('get_messages')}")
-    print(f"Resume message limit: {get_rate_limit_string('resume_message')}")
-    
-    print("✅ Rate limiting configuration test completed")
-
-def test_rate_limits():
-    """Test rate limit strings."""
-    print("\n=== Testing Rate Limit Strings ===")
-    
-    expected_limits = {
-        'create_session': '10/minute',
-        'list_sessions': '30/minute',
-        'create_message': '50/minute',
-        'get_messages': '100/minute',
-        'resume_message': '5/minute',
-        'update_session': '20/minute',
-        'delete_session': '10/minute',
-        'toggle_favorite': '20/minute',
-    }
-    
-    for endpoint, expected in expected_limits.items():
-        actual = get_rate_limit_string(endpoint)
-        if actual == expected:
-            print(f"✅ {endpoint}: {actual}")
-        else:
-            print(f"❌ {endpoint}: expected {expected}, got {actual}")
-
-if __name__ == "__main__":
-    print("Testing Rate Limiting Implementation...")
-    
-    test_rate_limiting_config()
-    test_rate_limits()
-    
-    print("\n🎉 Rate limiting implementation complete!")
-    print("\nFeatures implemented:")
-    print("- ✅ Redis-based rate limiting with slowapi")
-    print("- ✅ Configurable rate limits per endpoint")
-    print("- ✅ IP-based rate limiting")
-    print("- ✅ Rate limit headers in responses")
-    print("- ✅ Custom error handling")
-    print("- ✅ Environment-based enable/disable")
-    print("- ✅ Comprehensive logging")
-    
-    print("\nRate limits configured:")
-    print("- Create session: 10/minute")
-    print("- List sessions: 30/minute")
-    print("- Create message: 50/minute")
-    print("- Get messages: 100/minute")
-    print("- Resume message: 5/minute")
-    print("- Update session: 20/minute")
-    print("- Delete session: 10/minute")
-    print("- Toggle favorite: 20/minute")
\ No newline at end of file
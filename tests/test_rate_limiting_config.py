@@ -0,0 +1,49 @@
+"""
+Tests for the per-endpoint rate limit configuration.
+"""
+from types import MappingProxyType
+
+import pytest
+
+from chat_store.core import rate_limiter
+from chat_store.core.config import config
+from chat_store.core.rate_limiter import get_rate_limit_string
+
+EXPECTED_LIMITS = MappingProxyType({
+    "create_session": "10/minute",
+    "list_sessions": "30/minute",
+    "create_message": "50/minute",
+    "get_messages": "100/minute",
+    "resume_message": "5/minute",
+    "update_session": "20/minute",
+    "delete_session": "10/minute",
+    "toggle_favorite": "20/minute",
+})
+
+
+class TestRateLimitConfig:
+    """Tests for get_rate_limit_string."""
+
+    @staticmethod
+    def _use_config(monkeypatch, **changes):
+        """Point the rate limiter at a copy of the (frozen) config with `changes` applied."""
+        monkeypatch.setattr(rate_limiter, "config", config.model_copy(update=changes))
+
+    @pytest.fixture(autouse=True)
+    def rate_limiter_enabled(self, monkeypatch):
+        """Run every test with the rate limiter switched on."""
+        self._use_config(monkeypatch, RATE_LIMITER_ENABLED=True)
+
+    def test_rate_limit_strings(self):
+        """Test that each endpoint maps to its configured limit."""
+        assert {ep: get_rate_limit_string(ep) for ep in EXPECTED_LIMITS} == EXPECTED_LIMITS
+
+    def test_unknown_endpoint(self):
+        """Test that an endpoint without a configured limit fails loudly."""
+        with pytest.raises(KeyError, match="unknown_endpoint"):
+            get_rate_limit_string("unknown_endpoint")
+
+    def test_disabled_rate_limiter(self, monkeypatch):
+        """Test that no limits are returned while the rate limiter is disabled."""
+        self._use_config(monkeypatch, RATE_LIMITER_ENABLED=False)
+        assert get_rate_limit_string("create_session") is None
@@ -0,0 +1,128 @@
+"""
+Shared fixtures for the unit tests.
+
+Set USE_SQLITE_FOR_UNIT=1 to run them against an in-memory SQLite database
+instead of the Postgres test database.
+"""
+import os
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import ConnectionPool, Redis
+from redis.exceptions import RedisError
+from sqlalchemy import Select, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from chat_store.core.config import config
+from chat_store.db.base import Base
+
+
+USE_SQLITE_FOR_UNIT = os.getenv("USE_SQLITE_FOR_UNIT") == "1"
+
+
+def _create_sqlite_engine() -> AsyncEngine:
+    """Build an in-memory SQLite engine that supports the SAVEPOINT fixtures."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # Hand transaction control to SQLAlchemy so SAVEPOINTs nest correctly
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+if USE_SQLITE_FOR_UNIT:
+    @pytest_asyncio.fixture(scope="session", loop_scope="session")
+    async def db_engine() -> AsyncGenerator[AsyncEngine, None]:
+        """Create an in-memory SQLite engine with the schema built once per run."""
+        engine = _create_sqlite_engine()
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        yield engine
+
+        await engine.dispose()
+
+
+@pytest.fixture
+def bulk_add(db_session: AsyncSession) -> Callable[[type, list[dict[str, Any]]], Awaitable[None]]:
+    """Return a helper that inserts rows for `model` in one multi-values INSERT.
+
+    The INSERT runs straight away inside the test's transaction, so there is
+    nothing to flush or commit; the rows are rolled back with the test.
+    """
+    async def _bulk_add(model: type, rows: list[dict[str, Any]]) -> None:
+        await db_session.execute(insert(model), rows)
+
+    return _bulk_add
+
+
+@pytest.fixture
+def sql_statements(db_engine: AsyncEngine) -> Generator[list[str], None, None]:
+    """Record every SQL statement the engine sends while the test runs."""
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(db_engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def query_plan(db_session: AsyncSession) -> Callable[[Select], Awaitable[str]]:
+    """Return a helper that renders the database's plan for a SELECT as text.
+
+    On Postgres sequential scans are disabled first, so the plan names an
+    index whenever one can serve the query, however small the test tables are.
+    """
+    async def _query_plan(query: Select) -> str:
+        dialect = db_session.bind.dialect
+        if dialect.name == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        else:
+            await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+            prefix = "EXPLAIN "
+        compiled = query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        result = await db_session.execute(text(prefix + str(compiled)))
+        return "\n".join(str(row[-1]) for row in result)
+
+    return _query_plan
+
+
+@pytest_asyncio.fixture
+async def redis_pool() -> AsyncGenerator[ConnectionPool, None]:
+    """Connection pool to the configured Redis; skips the test when Redis is down.
+
+    Tests should write under a unique key prefix; every key under `test-rl-*`
+    is deleted afterwards.
+    """
+    pool = ConnectionPool.from_url(str(config.redis.REDIS_URI), socket_connect_timeout=1)
+    client = Redis(connection_pool=pool)
+    try:
+        await client.ping()
+    except RedisError as exc:
+        await pool.disconnect()
+        pytest.skip(f"Redis is not available: {exc}")
+
+    yield pool
+
+    async for key in client.scan_iter(match="test-rl-*"):
+        await client.delete(key)
+    await client.aclose()
+    await pool.disconnect()
@@ -0,0 +1,24 @@
+"""
+Row builders for the unit tests.
+
+They return plain dicts for ``insert(Model)`` / the ``bulk_add`` fixture, so
+rows that only need to exist in the database never go through the ORM
+constructors.
+"""
+from typing import Any
+from uuid import UUID
+
+from chat_store.models.message import Sender
+
+
+def session_rows(user_id: UUID, count: int, **overrides: Any) -> list[dict[str, Any]]:
+    """Build `count` session rows for `user_id` named "Session 0", "Session 1", ..."""
+    return [{"user_id": user_id, "name": f"Session {i}", **overrides} for i in range(count)]
+
+
+def message_rows(session_id: UUID, count: int, **overrides: Any) -> list[dict[str, Any]]:
+    """Build `count` user message rows for `session_id` with contents "Message 0", "Message 1", ..."""
+    return [
+        {"session_id": session_id, "sender": Sender.USER, "content": f"Message {i}", **overrides}
+        for i in range(count)
+    ]
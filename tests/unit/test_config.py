@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+from chat_store.core.config import Config, DatabaseConfig
+
+
+class TestDatabaseConnectionBudget:
+    """Unit tests for the workers x pool size check in Config."""
+
+    def test_default_pool_fits_default_workers(self):
+        """Test that the default worker cap fits the default per-worker pool."""
+        config = Config(WEB_CONCURRENCY=4)
+        db = config.database
+        assert 4 * (db.DATABASE_POOL_SIZE + db.DATABASE_MAX_OVERFLOW) <= db.DATABASE_MAX_CONNECTIONS
+
+    def test_too_many_workers_rejected(self):
+        """Test that a worker count that would exhaust the database is refused."""
+        with pytest.raises(ValidationError, match="DATABASE_MAX_CONNECTIONS"):
+            Config(WEB_CONCURRENCY=20)
+
+    def test_budget_follows_pool_settings(self):
+        """Test that the budget is computed from the configured pool size and overflow."""
+        database = DatabaseConfig(DATABASE_POOL_SIZE=20, DATABASE_MAX_OVERFLOW=10)
+        with pytest.raises(ValidationError, match="4 workers x 30 pooled connections"):
+            Config(WEB_CONCURRENCY=4, database=database)
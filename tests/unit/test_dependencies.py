@@ -0,0 +1,44 @@
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from chat_store.db.base import get_db
+from chat_store.dependencies import get_message_service, get_session_service
+from chat_store.services.message_service import MessageService
+from chat_store.services.session_service import SessionService
+
+
+class TestDependencies:
+    """Unit tests for request-scoped dependency wiring."""
+
+    async def test_services_share_one_db_session_per_request(self):
+        """Test that every repository in a request gets the same DB session."""
+        opened = []
+
+        async def counting_get_db():
+            session = object()
+            opened.append(session)
+            yield session
+
+        app = FastAPI()
+        app.dependency_overrides[get_db] = counting_get_db
+
+        @app.get("/probe")
+        async def probe(
+            session_service: SessionService = Depends(get_session_service),
+            message_service: MessageService = Depends(get_message_service),
+        ):
+            sessions = {
+                id(session_service.repository.db),
+                id(message_service.message_repository.db),
+                id(message_service.session_repository.db),
+            }
+            return {"distinct_sessions": len(sessions)}
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get("/probe")
+            second = await client.get("/probe")
+
+        assert first.json() == {"distinct_sessions": 1}
+        assert second.json() == {"distinct_sessions": 1}
+        # One session per request, not one per dependency
+        assert len(opened) == 2
@@ -1,11 +1,17 @@
+import itertools
 import pytest
 import pytest_asyncio
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 
 from chat_store.repositories.message_repository import MessageRepository
 from chat_store.models.message import Message, MessageStatus, Sender
+from chat_store.models.session import Session
+from tests.unit.factories import message_rows
+
+TEST_CONTEXT = {"test": True}
+RESPONSE_CONTEXT = {"response": True}
 
 
 class TestMessageRepository:
@@ -19,39 +25,35 @@ class TestMessageRepository:
     @pytest_asyncio.fixture
     async def test_session(self, db_session: AsyncSession):
         """Create a test session for message tests."""
-        from chat_store.models.session import Session
-        session = Session(user_id="test-user-123", name="Test Session")
-        db_session.add(session)
-        await db_session.commit()
-        await db_session.refresh(session)
+        session = await db_session.scalar(
+            insert(Session)
+            .values(user_id=UUID("a6ee4dde-c95d-4644-a842-13d4fadea71e"), name="Test Session")
+            .returning(Session)
+        )
         return session
 
     @pytest_asyncio.fixture
     async def test_message(self, db_session: AsyncSession, test_session):
         """Create a test message."""
-        message = Message(
-            session_id=test_session.id,
-            sender=Sender.USER,
-            content="Test message content",
-            context={"test": True}
+        message = await db_session.scalar(
+            insert(Message)
+            .values(
+                session_id=test_session.id,
+                sender=Sender.USER,
+                content="Test message content",
+                context=TEST_CONTEXT,
+            )
+            .returning(Message)
         )
-        db_session.add(message)
-        await db_session.commit()
-        await db_session.refresh(message)
         return message
 
-    async def test_create_message(self, repository: MessageRepository):
+    async def test_create_message(self, repository: MessageRepository, test_session):
         """Test creating a new message."""
-        # Create a session first
-        from chat_store.models.session import Session
-        session = Session(user_id="test-user-456", name="Test Session")
-        # This would need to be handled differently in actual tests
-        
         message = Message(
-            session_id=UUID("12345678-1234-1234-1234-123456789abc"),
+            session_id=test_session.id,
             sender=Sender.AI,
             content="Test AI response",
-            context={"response": True}
+            context=RESPONSE_CONTEXT
         )
         
         created = await repository.create(message)
@@ -61,6 +63,20 @@ class TestMessageRepository:
         assert created.content == "Test AI response"
         assert created.status == MessageStatus.PENDING
 
+    async def test_bulk_create(self, repository: MessageRepository, test_session, sql_statements):
+        """Test creating several messages at once."""
+        messages = [
+            Message(session_id=test_session.id, sender=Sender.USER, content=f"Message {i}")
+            for i in range(3)
+        ]
+        
+        created = await repository.bulk_create(messages)
+        
+        assert len(created) == 3
+        assert sum(s.lstrip().startswith("INSERT") for s in sql_statements) == 1
+        assert all(m.id is not None and m.timestamp is not None for m in created)
+        assert await repository.count_by_session(test_session.id) == 3
+
     async def test_get_by_id(self, repository: MessageRepository, test_message):
         """Test getting message by ID."""
         retrieved = await repository.get_by_id(test_message.id)
@@ -69,57 +85,75 @@ class TestMessageRepository:
         assert retrieved.id == test_message.id
         assert retrieved.content == test_message.content
 
-    async def test_list_by_session(self, repository: MessageRepository, db_session, test_session):
+    async def test_list_by_session(self, repository: MessageRepository, bulk_add, test_session):
         """Test listing messages by session."""
-        # Create multiple messages
-        messages = []
-        for i in range(3):
-            msg = Message(
-                session_id=test_session.id,
-                sender=Sender.USER if i % 2 == 0 else Sender.AI,
-                content=f"Message {i}"
-            )
-            messages.append(msg)
-            db_session.add(msg)
-        await db_session.commit()
+        # Create multiple messages, alternating senders
+        senders = itertools.cycle((Sender.USER, Sender.AI))
+        await bulk_add(Message, [
+            {
+                "session_id": test_session.id,
+                "sender": next(senders),
+                "content": f"Message {i}",
+            }
+            for i in range(3)
+        ])
         
         listed = await repository.list_by_session(test_session.id)
         assert len(listed) == 3
         assert all(m.session_id == test_session.id for m in listed)
 
-    async def test_count_by_session(self, repository: MessageRepository, db_session, test_session):
+    async def test_count_by_session(self, repository: MessageRepository, bulk_add, test_session, sql_statements):
         """Test counting messages by session."""
         # Create messages
-        for i in range(5):
-            msg = Message(
-                session_id=test_session.id,
-                sender=Sender.USER,
-                content=f"Message {i}"
-            )
-            db_session.add(msg)
-        await db_session.commit()
+        await bulk_add(Message, message_rows(test_session.id, 5))
+        sql_statements.clear()
         
         count = await repository.count_by_session(test_session.id)
         assert count == 5
+        assert len([s for s in sql_statements if s.lstrip().startswith("SELECT")]) == 1
+
+    async def test_count_by_session_uses_index(self, query_plan, test_session):
+        """Test that counting a session's messages is served by an index."""
+        plan = await query_plan(
+            select(func.count()).where(Message.session_id == test_session.id)
+        )
+        assert "ix_messages_session_id_timestamp" in plan
+
+    async def test_list_and_count_by_session(self, repository: MessageRepository, bulk_add, test_session):
+        """Test listing a page of messages together with the session total."""
+        await bulk_add(Message, message_rows(test_session.id, 5))
+        
+        page, total = await repository.list_and_count_by_session(test_session.id, skip=1, limit=2)
+        assert len(page) == 2
+        assert total == 5
+        
+        # A page past the end still reports the total
+        page, total = await repository.list_and_count_by_session(test_session.id, skip=10, limit=2)
+        assert page == []
+        assert total == 5
 
-    async def test_get_latest_by_session(self, repository: MessageRepository, db_session, test_session):
+    async def test_get_latest_by_session(self, repository: MessageRepository, bulk_add, test_session):
         """Test getting latest message by session."""
-        # Create messages with different timestamps
-        messages = []
-        for i in range(3):
-            msg = Message(
-                session_id=test_session.id,
-                sender=Sender.USER,
-                content=f"Message {i}"
-            )
-            messages.append(msg)
-            db_session.add(msg)
-        await db_session.commit()
+        # Create messages
+        await bulk_add(Message, message_rows(test_session.id, 3))
         
         latest = await repository.get_latest_by_session(test_session.id)
         assert latest is not None
         assert latest.session_id == test_session.id
 
+    async def test_get_latest_by_session_uses_index(self, query_plan, test_session):
+        """Test that the latest message is read off the composite index without a sort."""
+        plan = await query_plan(
+            select(Message)
+            .where(Message.session_id == test_session.id)
+            .order_by(Message.timestamp.desc())
+            .limit(1)
+        )
+        assert "ix_messages_session_id_timestamp" in plan
+        # Postgres shows a Sort node, SQLite a temp B-tree, when it has to sort
+        assert "Sort" not in plan
+        assert "TEMP B-TREE" not in plan
+
     async def test_update_message(self, repository: MessageRepository, test_message):
         """Test updating message."""
         updated = await repository.update(
@@ -132,6 +166,38 @@ class TestMessageRepository:
         assert updated.status == MessageStatus.COMPLETE
         assert updated.content == "Updated content"
 
+    async def test_update_status(self, repository: MessageRepository, test_message):
+        """Test updating message status."""
+        updated = await repository.update_status(
+            test_message.id,
+            MessageStatus.FAILED,
+            error_message="Upstream timeout"
+        )
+        
+        assert updated == (test_message.id, MessageStatus.FAILED)
+
+    async def test_update_status_nonexistent_message(self, repository: MessageRepository):
+        """Test updating status of non-existent message."""
+        fake_id = UUID("12345678-1234-1234-1234-123456789abc")
+        updated = await repository.update_status(fake_id, MessageStatus.COMPLETE)
+        assert updated is None
+
+    async def test_resume_latest_by_session(self, repository: MessageRepository, test_message):
+        """Test resuming the latest message of a session."""
+        await repository.update_status(test_message.id, MessageStatus.FAILED, error_message="Upstream timeout")
+        
+        resumed = await repository.resume_latest_by_session(test_message.session_id)
+        
+        assert resumed == (test_message.id, MessageStatus.PENDING)
+
+    async def test_resume_latest_by_session_not_resumable(self, repository: MessageRepository, test_message):
+        """Test that a completed latest message is not resumed."""
+        await repository.update_status(test_message.id, MessageStatus.COMPLETE)
+        
+        resumed = await repository.resume_latest_by_session(test_message.session_id)
+        
+        assert resumed is None
+
     async def test_delete_message(self, repository: MessageRepository, test_message):
         """Test deleting message."""
         success = await repository.delete(test_message.id)
@@ -140,12 +206,34 @@ class TestMessageRepository:
         retrieved = await repository.get_by_id(test_message.id)
         assert retrieved is None
 
-    async def test_exists(self, repository: MessageRepository, test_message):
-        """Test checking if message exists."""
-        exists = await repository.exists(test_message.id)
-        assert exists is True
+    @pytest.fixture
+    def stored_message(self, request: pytest.FixtureRequest):
+        """Resolve the parametrized flag to a stored message, or None for the missing case."""
+        if request.param:
+            return request.getfixturevalue("test_message")
+        return None
+
+    @pytest.mark.parametrize("method,attribute", [("exists", "id"), ("exists_in_session", "session_id")])
+    @pytest.mark.parametrize(
+        "stored_message,expected", [(True, True), (False, False)], indirect=["stored_message"]
+    )
+    async def test_exists(
+        self,
+        repository: MessageRepository,
+        sql_statements: list[str],
+        method: str,
+        attribute: str,
+        stored_message,
+        expected: bool,
+    ):
+        """Test that the exists checks answer with a single SELECT EXISTS, never loading rows."""
+        if stored_message is not None:
+            lookup_id = getattr(stored_message, attribute)
+        else:
+            lookup_id = UUID("12345678-1234-1234-1234-123456789abc")
+        sql_statements.clear()
 
-    async def test_exists_in_session(self, repository: MessageRepository, test_message):
-        """Test checking if messages exist in session."""
-        exists = await repository.exists_in_session(test_message.session_id)
-        assert exists is True
\ No newline at end of file
+        assert await getattr(repository, method)(lookup_id) is expected
+        selects = [s for s in sql_statements if s.lstrip().startswith("SELECT")]
+        assert len(selects) == 1
+        assert selects[0].lstrip().startswith("SELECT EXISTS")
\ No newline at end of file
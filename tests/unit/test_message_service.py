@@ -0,0 +1,55 @@
+import pytest
+import pytest_asyncio
+from uuid import UUID
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from chat_store.models.session import Session
+from chat_store.repositories.message_repository import MessageRepository
+from chat_store.repositories.session_repository import SessionRepository
+from chat_store.services.message_service import MessageService
+
+
+class TestMessageService:
+    """Unit tests for MessageService's session lookups."""
+
+    @pytest_asyncio.fixture
+    async def service(self, db_session: AsyncSession) -> MessageService:
+        """Create a message service over the test's session."""
+        return MessageService(MessageRepository(db_session), SessionRepository(db_session))
+
+    @pytest_asyncio.fixture
+    async def session_id(self, db_session: AsyncSession) -> UUID:
+        """Insert an empty chat session and return its id."""
+        return await db_session.scalar(
+            insert(Session)
+            .values(user_id=UUID("a6ee4dde-c95d-4644-a842-13d4fadea71e"), name="Test Session")
+            .returning(Session.id)
+        )
+
+    async def _delete_elsewhere(self, db_session: AsyncSession, session_id: UUID) -> None:
+        """Delete the session the way another worker would, bypassing this service."""
+        await db_session.execute(delete(Session).where(Session.id == session_id))
+
+    async def test_empty_page_of_deleted_session_is_not_found(
+        self, service: MessageService, db_session: AsyncSession, session_id: UUID
+    ):
+        """Test that a session seen earlier is reported missing once it has been deleted."""
+        assert await service.get_session_messages(session_id) == ([], 0)
+
+        await self._delete_elsewhere(db_session, session_id)
+
+        with pytest.raises(ValueError, match="not found"):
+            await service.get_session_messages(session_id)
+
+    async def test_resume_in_deleted_session_is_not_found(
+        self, service: MessageService, db_session: AsyncSession, session_id: UUID
+    ):
+        """Test that resuming in a session deleted since it was last seen reports the session missing."""
+        with pytest.raises(ValueError, match="No messages found"):
+            await service.resume_failed_message(session_id)
+
+        await self._delete_elsewhere(db_session, session_id)
+
+        with pytest.raises(ValueError, match=f"Session {session_id} not found"):
+            await service.resume_failed_message(session_id)
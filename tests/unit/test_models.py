@@ -1,55 +1,54 @@
-from uuid import uuid4
+from uuid import UUID
 from datetime import datetime, timezone
 
 from chat_store.models.session import Session
 from chat_store.models.message import Message, MessageStatus, Sender
 
+FROZEN_USER = UUID("00000000-0000-0000-0000-000000000001")
+FROZEN_SESSION = UUID("00000000-0000-0000-0000-000000000002")
+FROZEN_MESSAGE = UUID("00000000-0000-0000-0000-000000000003")
+FROZEN_TS = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
 
 class TestSessionModel:
     def test_session_creation(self):
-        user_id = uuid4()
         session = Session(
-            id=uuid4(),
-            user_id=user_id,
+            id=FROZEN_SESSION,
+            user_id=FROZEN_USER,
             name="Test Chat",
             is_favorite=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=FROZEN_TS,
+            updated_at=FROZEN_TS,
         )
-        assert session.user_id == user_id
+        assert session.user_id == FROZEN_USER
         assert session.name == "Test Chat"
         assert session.is_favorite is True
-        assert session.created_at is not None
-        assert session.updated_at is not None
+        assert session.created_at == FROZEN_TS
+        assert session.updated_at == FROZEN_TS
 
 
 class TestMessageModel:
     def test_message_creation(self):
-        session_id = uuid4()
         message = Message(
-            id=uuid4(),
-            session_id=session_id,
+            id=FROZEN_MESSAGE,
+            session_id=FROZEN_SESSION,
             sender=Sender.USER,
             content="Hello, world!",
             status=MessageStatus.PENDING,
             context={"key": "value"},
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=FROZEN_TS,
+            updated_at=FROZEN_TS,
         )
-        assert message.session_id == session_id
+        assert message.session_id == FROZEN_SESSION
         assert message.sender == Sender.USER
         assert message.content == "Hello, world!"
         assert message.status == MessageStatus.PENDING
         assert message.context == {"key": "value"}
-        assert message.created_at is not None
-        assert message.updated_at is not None
+        assert message.created_at == FROZEN_TS
+        assert message.updated_at == FROZEN_TS
 
     def test_message_status_enum(self):
-        assert MessageStatus.PENDING.value == "pending"
-        assert MessageStatus.IN_PROGRESS.value == "in_progress"
-        assert MessageStatus.COMPLETE.value == "complete"
-        assert MessageStatus.FAILED.value == "failed"
+        assert {m.value for m in MessageStatus} == {"pending", "in_progress", "complete", "failed"}
 
     def test_sender_enum(self):
-        assert Sender.USER.value == "user"
-        assert Sender.AI.value == "ai"
\ No newline at end of file
+        assert {m.value for m in Sender} == {"user", "ai"}
@@ -0,0 +1,258 @@
+from types import SimpleNamespace
+from typing import AsyncGenerator
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request, Response
+from httpx import ASGITransport, AsyncClient
+from redis.asyncio import ConnectionPool, Redis
+
+from chat_store.api.v1.endpoints import sessions as session_endpoints
+from chat_store.core import rate_limiter
+from chat_store.core.config import config
+from chat_store.core.rate_limiter import (
+    ApproximateWindowLimiter,
+    SlidingWindowLimiter,
+    _build_limiters,
+    _NoopLimiter,
+    get_rate_limit_string,
+    limiter_fast,
+    limiter_strict,
+    parse_rate_limit,
+)
+
+MINUTE_MS = 60_000
+# A fixed clock, aligned to a minute boundary
+T0_MS = 1_700_000_040_000
+
+# Endpoint -> (limiter, endpoint type of its limit). Mutating endpoints need
+# the exact sliding window, high-QPS reads get the approximate one.
+ENDPOINT_LIMITERS = {
+    "create_session": ("strict", "create_session"),
+    "list_sessions": ("fast", "list_sessions"),
+    "update_session": ("strict", "update_session"),
+    "toggle_favorite": ("strict", "toggle_favorite"),
+    "delete_session": ("strict", "delete_session"),
+    "create_session_message": ("strict", "create_message"),
+    "list_session_messages": ("fast", "get_messages"),
+    "get_session_message": ("fast", "get_messages"),
+    "resume_session_message": ("strict", "resume_message"),
+}
+
+
+def _limited_app(limiter: SlidingWindowLimiter, limit_value: str) -> FastAPI:
+    """Build an app with a single endpoint behind `limiter.limit(limit_value)`."""
+    app = FastAPI()
+
+    @app.get("/limited")
+    @limiter.limit(limit_value)
+    async def limited(request: Request, response: Response):
+        return {"ok": True}
+
+    return app
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[int]:
+    """Freeze the limiter's clock; set `clock[0]` (milliseconds) to move it."""
+    now_ms = [T0_MS]
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time_ns=lambda: now_ms[0] * 1_000_000))
+    return now_ms
+
+
+class TestParseRateLimit:
+    """Unit tests for parse_rate_limit."""
+
+    @pytest.mark.parametrize("limit_value,expected", [
+        ("10/second", (10, 1_000)),
+        ("10/minute", (10, 60_000)),
+        ("5/hour", (5, 3_600_000)),
+        ("1/day", (1, 86_400_000)),
+        ("20/minutes", (20, 60_000)),
+        (" 3 / Minute ", (3, 60_000)),
+    ])
+    def test_valid(self, limit_value, expected):
+        """Test that amounts and periods (any case, singular or plural) are parsed."""
+        assert parse_rate_limit(limit_value) == expected
+
+    @pytest.mark.parametrize("limit_value", ["", "10", "ten/minute", "-1/minute", "1.5/minute", "10/fortnight", "/minute"])
+    def test_invalid(self, limit_value):
+        """Test that malformed limits are rejected with a ValueError."""
+        with pytest.raises(ValueError, match="Invalid rate limit"):
+            parse_rate_limit(limit_value)
+
+
+class TestSlidingWindowLimiter:
+    """Unit tests for SlidingWindowLimiter against a real Redis."""
+
+    @pytest_asyncio.fixture
+    async def limiter(self, redis_pool: ConnectionPool) -> AsyncGenerator[SlidingWindowLimiter, None]:
+        """Create a limiter writing under a key prefix unique to the test."""
+        limiter = SlidingWindowLimiter(redis_pool, key_prefix=f"test-rl-{uuid4().hex}")
+        yield limiter
+        await limiter.close()
+
+    async def test_allows_up_to_amount_then_denies(self, limiter: SlidingWindowLimiter, redis_pool: ConnectionPool):
+        """Test that the hit at the limit is allowed and the ones after it are not recorded."""
+        key = f"{limiter.key_prefix}:boundary"
+
+        counts = [await limiter.hit(key, 3, MINUTE_MS) for _ in range(5)]
+
+        # hit() returns the count before the request; >= amount means denied
+        assert counts == [0, 1, 2, 3, 3]
+        async with Redis(connection_pool=redis_pool) as client:
+            assert await client.zcard(key) == 3
+
+    async def test_hits_leave_the_window(self, limiter: SlidingWindowLimiter, clock: list[int]):
+        """Test that hits older than the window no longer count."""
+        key = f"{limiter.key_prefix}:expiry"
+        assert await limiter.hit(key, 2, MINUTE_MS) == 0
+        clock[0] += 30_000
+        assert await limiter.hit(key, 2, MINUTE_MS) == 1
+        assert await limiter.hit(key, 2, MINUTE_MS) == 2
+
+        # The first hit falls out of the window, the second is still in it
+        clock[0] += 30_001
+        assert await limiter.hit(key, 2, MINUTE_MS) == 1
+
+    async def test_reloads_flushed_script(self, limiter: SlidingWindowLimiter, redis_pool: ConnectionPool):
+        """Test that a hit still succeeds after Redis dropped the cached script."""
+        key = f"{limiter.key_prefix}:reload"
+        assert await limiter.hit(key, 5, MINUTE_MS) == 0
+
+        async with Redis(connection_pool=redis_pool) as client:
+            await client.script_flush()
+
+        assert await limiter.hit(key, 5, MINUTE_MS) == 1
+
+    async def test_limit_sets_headers_and_returns_429(self, limiter: SlidingWindowLimiter):
+        """Test the rate limit headers on allowed requests and the 429 once exhausted."""
+        app = _limited_app(limiter, "2/minute")
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            responses = [await client.get("/limited") for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert [r.headers["X-RateLimit-Remaining"] for r in responses] == ["1", "0", "0"]
+        assert all(r.headers["X-RateLimit-Limit"] == "2" for r in responses)
+
+        rejected = responses[2]
+        assert rejected.headers["Retry-After"] == "60"
+        assert rejected.json() == {"detail": "Rate limit exceeded: 2/minute"}
+
+    async def test_fails_open_when_redis_is_down(self):
+        """Test that requests go through, unlimited, when Redis cannot be reached."""
+        pool = ConnectionPool.from_url("redis://localhost:1", socket_connect_timeout=0.2)
+        limiter = SlidingWindowLimiter(pool, key_prefix=f"test-rl-{uuid4().hex}")
+        app = _limited_app(limiter, "1/minute")
+
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                responses = [await client.get("/limited") for _ in range(3)]
+        finally:
+            await limiter.close()
+            await pool.disconnect()
+
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert all("X-RateLimit-Limit" not in r.headers for r in responses)
+
+
+class TestApproximateWindowLimiter:
+    """Unit tests for ApproximateWindowLimiter's weighted two-counter estimate."""
+
+    @pytest_asyncio.fixture
+    async def limiter(self, redis_pool: ConnectionPool) -> AsyncGenerator[ApproximateWindowLimiter, None]:
+        """Create a limiter writing under a key prefix unique to the test."""
+        limiter = ApproximateWindowLimiter(redis_pool, key_prefix=f"test-rl-{uuid4().hex}")
+        yield limiter
+        await limiter.close()
+
+    async def test_allows_up_to_amount_then_denies(
+        self, limiter: ApproximateWindowLimiter, redis_pool: ConnectionPool, clock: list[int]
+    ):
+        """Test that the hit at the limit is allowed and the ones after it are not counted."""
+        key = f"{limiter.key_prefix}:boundary"
+        clock[0] = T0_MS + 1_000
+
+        counts = [await limiter.hit(key, 4, MINUTE_MS) for _ in range(6)]
+
+        assert counts == [0, 1, 2, 3, 4, 4]
+        async with Redis(connection_pool=redis_pool) as client:
+            assert await client.get(f"{key}:{T0_MS}") == b"4"
+
+    @pytest.mark.parametrize("elapsed_ms,carried_over", [
+        (0, 4),
+        (15_000, 3),
+        (30_000, 2),
+        (45_000, 1),
+        (59_999, 0),
+    ])
+    async def test_previous_window_is_weighted(
+        self, limiter: ApproximateWindowLimiter, clock: list[int], elapsed_ms: int, carried_over: int
+    ):
+        """Test that the previous window counts in proportion to its overlap with the sliding window."""
+        key = f"{limiter.key_prefix}:rollover"
+        clock[0] = T0_MS + 1_000
+        for _ in range(4):
+            await limiter.hit(key, 4, MINUTE_MS)
+
+        # Into the next fixed window: floor(4 * (window - elapsed) / window) hits carry over
+        clock[0] = T0_MS + MINUTE_MS + elapsed_ms
+        counts = [await limiter.hit(key, 4, MINUTE_MS) for _ in range(5 - carried_over)]
+
+        assert counts == [*range(carried_over, 4), 4]
+
+    async def test_older_windows_are_forgotten(self, limiter: ApproximateWindowLimiter, clock: list[int]):
+        """Test that hits two windows back no longer count."""
+        key = f"{limiter.key_prefix}:stale"
+        clock[0] = T0_MS + 1_000
+        for _ in range(4):
+            await limiter.hit(key, 4, MINUTE_MS)
+
+        clock[0] = T0_MS + 2 * MINUTE_MS + 1_000
+        assert await limiter.hit(key, 4, MINUTE_MS) == 0
+
+
+class TestLimiterWiring:
+    """Unit tests for how the limiters are built and attached to the endpoints."""
+
+    def test_every_route_is_listed(self):
+        """Test that each session route has an expected limiter, so new routes must pick one."""
+        endpoints = {route.endpoint.__name__ for route in session_endpoints.router.routes}
+        assert endpoints == set(ENDPOINT_LIMITERS)
+
+    @pytest.mark.skipif(not config.RATE_LIMITER_ENABLED, reason="rate limiting is disabled; endpoints are not wrapped")
+    @pytest.mark.parametrize("endpoint,expected", list(ENDPOINT_LIMITERS.items()))
+    def test_endpoint_limiter(self, endpoint, expected):
+        """Test that each endpoint is guarded by the intended limiter and limit."""
+        kind, endpoint_type = expected
+        handler = getattr(session_endpoints, endpoint)
+
+        assert handler.limiter is {"strict": limiter_strict, "fast": limiter_fast}[kind]
+        assert handler.rate_limit == get_rate_limit_string(endpoint_type)
+
+    def test_build_limiters_enabled(self):
+        """Test that an enabled config yields the two Redis limiters sharing one pool."""
+        pool, strict, fast = _build_limiters(config.model_copy(update={"RATE_LIMITER_ENABLED": True}))
+
+        assert type(strict) is SlidingWindowLimiter
+        assert type(fast) is ApproximateWindowLimiter
+        assert strict.connection_pool is pool
+        assert fast.connection_pool is pool
+
+    async def test_build_limiters_disabled(self):
+        """Test that a disabled config yields no pool and no-op limiters."""
+        pool, strict, fast = _build_limiters(config.model_copy(update={"RATE_LIMITER_ENABLED": False}))
+
+        assert pool is None
+        assert isinstance(strict, _NoopLimiter)
+        assert isinstance(fast, _NoopLimiter)
+
+        async def endpoint():
+            return None
+
+        # Endpoints are returned untouched, whatever the limit
+        assert strict.limit(None)(endpoint) is endpoint
+        assert fast.limit("1/minute")(endpoint) is endpoint
+        assert await strict.load_script() is None
@@ -1,10 +1,17 @@
+import pytest
 import pytest_asyncio
 from datetime import datetime
 from uuid import UUID
+from sqlalchemy import func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from chat_store.repositories.session_repository import SessionRepository
 from chat_store.models.session import Session
+from chat_store.models.message import Message, Sender
+from tests.unit.factories import session_rows
+
+USER_1 = UUID("a6ee4dde-c95d-4644-a842-13d4fadea71e")
+USER_2 = UUID("b6ee4dde-c95d-4644-a842-13d4fadea71e")
 
 
 class TestSessionRepository:
@@ -18,20 +25,17 @@ class TestSessionRepository:
     @pytest_asyncio.fixture
     async def test_session(self, db_session: AsyncSession) -> Session:
         """Create a test session."""
-        session = Session(
-            user_id="a6ee4dde-c95d-4644-a842-13d4fadea71e",
-            name="Test Session",
-            is_favorite=False
+        session = await db_session.scalar(
+            insert(Session)
+            .values(user_id=USER_1, name="Test Session", is_favorite=False)
+            .returning(Session)
         )
-        db_session.add(session)
-        await db_session.commit()
-        await db_session.refresh(session)
         return session
 
     async def test_create_session(self, repository: SessionRepository):
         """Test creating a new session."""
         session = Session(
-            user_id="a6ee4dde-c95d-4644-a842-13d4fadea71e",
+            user_id=USER_1,
             name="New Test Session",
             is_favorite=True
         )
@@ -39,12 +43,23 @@ class TestSessionRepository:
         created = await repository.create(session)
         
         assert created.id is not None
-        assert created.user_id == "a6ee4dde-c95d-4644-a842-13d4fadea71e"
+        assert created.user_id == USER_1
         assert created.name == "New Test Session"
         assert created.is_favorite is True
         assert isinstance(created.created_at, datetime)
         assert isinstance(created.updated_at, datetime)
 
+    async def test_bulk_create(self, repository: SessionRepository, sql_statements):
+        """Test creating several sessions at once."""
+        sessions = [Session(user_id=USER_1, name=f"Session {i}") for i in range(3)]
+        
+        created = await repository.bulk_create(sessions)
+        
+        assert len(created) == 3
+        assert all(s.id is not None and s.created_at is not None for s in created)
+        assert sum(s.lstrip().startswith("INSERT") for s in sql_statements) == 1
+        assert await repository.count_by_user(USER_1) == 3
+
     async def test_get_by_id(self, repository: SessionRepository, test_session: Session):
         """Test getting session by ID."""
         retrieved = await repository.get_by_id(test_session.id)
@@ -60,51 +75,66 @@ class TestSessionRepository:
         
         assert retrieved is None
 
-    async def test_list_by_user(self, repository: SessionRepository, db_session: AsyncSession):
+    async def test_list_by_user(self, repository: SessionRepository, bulk_add):
         """Test listing sessions by user."""
         # Create multiple sessions for the same user
-        sessions = [
-            Session(user_id="user-1", name="Session 1", is_favorite=True),
-            Session(user_id="user-1", name="Session 2", is_favorite=False),
-            Session(user_id="user-2", name="Session 3", is_favorite=False),
-        ]
+        await bulk_add(Session, [
+            {"user_id": USER_1, "name": "Session 1", "is_favorite": True},
+            {"user_id": USER_1, "name": "Session 2", "is_favorite": False},
+            {"user_id": USER_2, "name": "Session 3", "is_favorite": False},
+        ])
         
-        for session in sessions:
-            db_session.add(session)
-        await db_session.commit()
-        
-        # Test listing for user-1
-        user1_sessions = await repository.list_by_user("user-1")
+        # Test listing for user 1
+        user1_sessions = await repository.list_by_user(USER_1)
         assert len(user1_sessions) == 2
-        assert all(s.user_id == "user-1" for s in user1_sessions)
+        assert all(s.user_id == USER_1 for s in user1_sessions)
 
-    async def test_list_by_user_with_pagination(self, repository: SessionRepository, db_session: AsyncSession):
+    async def test_list_by_user_with_pagination(self, repository: SessionRepository, bulk_add):
         """Test listing sessions with pagination."""
         # Create 5 sessions
-        for i in range(5):
-            session = Session(user_id="a6ee4dde-c95d-4644-a842-13d4fadea71e", name=f"Session {i}")
-            db_session.add(session)
-        await db_session.commit()
+        await bulk_add(Session, session_rows(USER_1, 5))
         
         # Test pagination
-        sessions = await repository.list_by_user("user-1", skip=2, limit=2)
+        sessions = await repository.list_by_user(USER_1, skip=2, limit=2)
         assert len(sessions) == 2
 
-    async def test_count_by_user(self, repository: SessionRepository, db_session: AsyncSession):
+    async def test_list_by_user_with_messages(self, repository: SessionRepository, db_session: AsyncSession):
+        """Test listing sessions by user with their messages batch-loaded."""
+        user_id = USER_1
+        first = Session(user_id=user_id, name="Session 1")
+        second = Session(user_id=user_id, name="Session 2")
+        db_session.add_all([first, second])
+        await db_session.flush()
+        db_session.add_all([
+            Message(session_id=first.id, sender=Sender.USER, content="Hello"),
+            Message(session_id=first.id, sender=Sender.AI, content="Hi there"),
+        ])
+        await db_session.flush()
+        db_session.expunge_all()
+
+        sessions = await repository.list_by_user_with_messages(user_id)
+
+        message_counts = {s.name: len(s.messages) for s in sessions}
+        assert message_counts == {"Session 1": 2, "Session 2": 0}
+
+    async def test_count_by_user(self, repository: SessionRepository, bulk_add, sql_statements):
         """Test counting sessions by user."""
         # Create sessions
-        sessions = [
-            Session(user_id="a6ee4dde-c95d-4644-a842-13d4fadea71e", name="Session 1"),
-            Session(user_id="b6ee4dde-c95d-4644-a842-13d4fadea71e", name="Session 2"),
-            Session(user_id="c6ee4dde-c95d-4644-a842-13d4fadea71e", name="Session 3"),
-        ]
-        
-        for session in sessions:
-            db_session.add(session)
-        await db_session.commit()
+        await bulk_add(Session, [
+            {"user_id": USER_1, "name": "Session 1"},
+            {"user_id": USER_1, "name": "Session 2"},
+            {"user_id": USER_2, "name": "Session 3"},
+        ])
+        sql_statements.clear()
         
-        count = await repository.count_by_user("user-1")
+        count = await repository.count_by_user(USER_1)
         assert count == 2
+        assert len([s for s in sql_statements if s.lstrip().startswith("SELECT")]) == 1
+
+    async def test_count_by_user_uses_index(self, query_plan):
+        """Test that counting a user's sessions is served by an index."""
+        plan = await query_plan(select(func.count()).where(Session.user_id == USER_1))
+        assert "ix_sessions_user_id" in plan
 
     async def test_update_session(self, repository: SessionRepository, test_session: Session):
         """Test updating session."""
@@ -140,13 +170,27 @@ class TestSessionRepository:
         success = await repository.delete(fake_id)
         assert success is False
 
-    async def test_exists(self, repository: SessionRepository, test_session: Session):
-        """Test checking if session exists."""
-        exists = await repository.exists(test_session.id)
-        assert exists is True
-
-    async def test_exists_false(self, repository: SessionRepository):
-        """Test checking if non-existent session exists."""
-        fake_id = UUID("12345678-1234-1234-1234-123456789abc")
-        exists = await repository.exists(fake_id)
-        assert exists is False
\ No newline at end of file
+    @pytest.fixture
+    def lookup_session_id(self, request: pytest.FixtureRequest) -> UUID:
+        """Resolve the parametrized flag to a stored session's id or an unknown id."""
+        if request.param:
+            return request.getfixturevalue("test_session").id
+        return UUID("12345678-1234-1234-1234-123456789abc")
+
+    @pytest.mark.parametrize(
+        "lookup_session_id,expected", [(True, True), (False, False)], indirect=["lookup_session_id"]
+    )
+    async def test_exists(
+        self,
+        repository: SessionRepository,
+        sql_statements: list[str],
+        lookup_session_id: UUID,
+        expected: bool,
+    ):
+        """Test that exists answers with a single SELECT EXISTS, never loading the row."""
+        sql_statements.clear()
+
+        assert await repository.exists(lookup_session_id) is expected
+        selects = [s for s in sql_statements if s.lstrip().startswith("SELECT")]
+        assert len(selects) == 1
+        assert selects[0].lstrip().startswith("SELECT EXISTS")
\ No newline at end of file